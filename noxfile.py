@@ -1,7 +1,27 @@
 """Nox configuration for testing pytreqt across multiple Python/pytest versions."""
 
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import nox
 
+# Keep session virtualenvs between runs; installs are skipped when unchanged
+nox.options.reuse_existing_virtualenvs = True
+
+NOXFILE = Path(__file__)
+PYPROJECT = NOXFILE.parent / "pyproject.toml"
+
+# Prebuilt wheels shared by all sessions once built with `nox -s wheelhouse`
+WHEELHOUSE = NOXFILE.parent / ".nox" / "wheelhouse"
+
+# Concurrent pip installs contend for the network and the pip cache
+MAX_PARALLEL_INSTALLS = 2
+
 # Python versions to test
 PYTHON_VERSIONS = ["3.10", "3.11", "3.12", "3.13"]
 
@@ -9,6 +29,71 @@ PYTHON_VERSIONS = ["3.10", "3.11", "3.12", "3.13"]
 PYTEST_VERSIONS = ["8.0", "8.3"]
 
 
+def _install_if_needed(session: nox.Session, *args: str) -> None:
+    """Run session.install unless this virtualenv already has the same install.
+
+    Installs are recorded in a JSON manifest inside the virtualenv, keyed by
+    the install arguments. A recorded install is reused as long as
+    pyproject.toml has not been modified since. Nothing is recorded when nox
+    skipped the install (--no-install with a reused virtualenv). If the
+    wheelhouse exists, packages are installed from it without network access.
+    """
+    location = getattr(session.virtualenv, "location", None)
+    if not location:
+        session.install(*args)
+        return
+
+    # Install offline from the shared wheelhouse when it has been built
+    if WHEELHOUSE.is_dir():
+        args = ("--no-index", "--find-links", str(WHEELHOUSE), *args)
+
+    manifest = Path(location) / ".install_cache"
+    try:
+        installed = json.loads(manifest.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        installed = {}
+
+    key = json.dumps(args)
+    if key in installed and PYPROJECT.stat().st_mtime <= installed[key]:
+        session.log(f"Skipping install of {' '.join(args)} (up to date)")
+        return
+
+    session.install(*args)
+
+    # With --no-install (-R) nox skips installing into a reused virtualenv, so
+    # nothing was installed that could be recorded
+    no_install = session._runner.global_config.no_install
+    if no_install and getattr(session.virtualenv, "_reused", False):
+        return
+
+    installed[key] = time.time()
+    manifest.write_text(json.dumps(installed), encoding="utf-8")
+
+
+@nox.session(python=PYTHON_VERSIONS, default=False)
+def wheelhouse(session: nox.Session) -> None:
+    """Download and build wheels for all session dependencies.
+
+    Rerun after changing dependencies; delete .nox/wheelhouse to go back to
+    installing from the package index.
+    """
+    # One resolve per pytest version, as the pinned versions conflict
+    for pytest_version in PYTEST_VERSIONS:
+        session.run(
+            "python",
+            "-m",
+            "pip",
+            "wheel",
+            "--wheel-dir",
+            str(WHEELHOUSE),
+            ".[dev]",
+            f"pytest=={pytest_version}",
+            # Build requirements for the editable install of this project
+            "setuptools>=61.0",
+            "wheel",
+        )
+
+
 @nox.session(python=PYTHON_VERSIONS)
 @nox.parametrize("pytest_version", PYTEST_VERSIONS)
 def tests(session: nox.Session, pytest_version: str) -> None:
@@ -18,18 +103,28 @@ def tests(session: nox.Session, pytest_version: str) -> None:
         session.skip("Python 3.13 + pytest 8.0 has AST compatibility issues")
 
     # Install dependencies
-    session.install("-e", ".[dev]")
-    session.install(f"pytest=={pytest_version}")
+    _install_if_needed(session, "-e", ".[dev]")
+    _install_if_needed(session, f"pytest=={pytest_version}")
+
+    # Skip writing .pyc files for the assertion-rewritten test modules
+    session.env["PYTHONDONTWRITEBYTECODE"] = "1"
 
     # Run tests
-    session.run("pytest", "tests/", "-v", "--tb=short")
+    session.run("pytest", "tests/", "-v", "--tb=short", "--import-mode=importlib")
 
 
 @nox.session(python=PYTHON_VERSIONS)
-def lint(session: nox.Session) -> None:
-    """Run linting with different Python versions."""
-    session.install("-e", ".[dev]")
+def quality(session: nox.Session) -> None:
+    """Run linting and format checks in one session."""
+    _install_if_needed(session, "-e", ".[dev]")
     session.run("ruff", "check", "src/")
+    session.run("ruff", "format", "src/", "tests/", "--check")
+
+
+@nox.session(python=PYTHON_VERSIONS, default=False)
+def lint(session: nox.Session) -> None:
+    """Run linting with different Python versions (alias of quality)."""
+    quality(session)
 
 
 @nox.session(
@@ -37,36 +132,93 @@ def lint(session: nox.Session) -> None:
 )
 def mypy(session: nox.Session) -> None:
     """Run type checking with different Python versions."""
-    session.install("-e", ".[dev]")
+    _install_if_needed(session, "-e", ".[dev]")
     session.run("mypy", "src/")
 
 
-@nox.session(python=PYTHON_VERSIONS)
+@nox.session(python=PYTHON_VERSIONS, default=False)
 def format_check(session: nox.Session) -> None:
-    """Check code formatting."""
-    session.install("-e", ".[dev]")
-    session.run("ruff", "format", "src/", "tests/", "--check")
+    """Check code formatting (alias of quality)."""
+    quality(session)
 
 
 @nox.session
 def format(session: nox.Session) -> None:
     """Format code."""
-    session.install("-e", ".[dev]")
+    _install_if_needed(session, "-e", ".[dev]")
     session.run("ruff", "format", "src/", "tests/")
 
 
 @nox.session
 def newlines(session: nox.Session) -> None:
     """Check trailing newlines in files."""
-    session.install("-e", ".")
+    _install_if_needed(session, "-e", ".")
     session.run("python", "-m", "pytreqt.tools.check_newlines")
 
 
 @nox.session(python="3.12")
 def coverage(session: nox.Session) -> None:
     """Run tests with coverage reporting."""
-    session.install("-e", ".[dev]")
-    session.install("coverage[toml]")
-    session.run("coverage", "run", "-m", "pytest", "tests/")
-    session.run("coverage", "report")
-    session.run("coverage", "html")
+    # pytest-cov from the dev extras collects and reports in a single process
+    _install_if_needed(session, "-e", ".[dev]")
+    session.run(
+        "pytest",
+        "tests/",
+        "--import-mode=importlib",
+        "--cov=src/pytreqt",
+        "--cov-report=term",
+        "--cov-report=html",
+        "--no-cov-on-fail",
+    )
+
+
+def _run_nox(args: list[str]) -> tuple[str, int, str]:
+    """Run a nox subprocess for one session and capture its output."""
+    result = subprocess.run(
+        [sys.executable, "-m", "nox", "--noxfile", str(NOXFILE), *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    return args[-1], result.returncode, result.stdout
+
+
+def _run_sessions_parallel(
+    targets: list[str], extra_args: list[str], jobs: int
+) -> list[str]:
+    """Run each target session in its own nox process, returning failures."""
+    failed = []
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        runs = [
+            executor.submit(_run_nox, [*extra_args, "--sessions", target])
+            for target in targets
+        ]
+        # Print each session's buffered output in one block once it finishes
+        for run in runs:
+            target, returncode, output = run.result()
+            print(output, end="")
+            if returncode != 0:
+                failed.append(target)
+    return failed
+
+
+@nox.session(python=False, default=False)
+def parallel(session: nox.Session) -> None:
+    """Run the tests matrix in parallel, one nox process per Python version.
+
+    Pass session names after ``--`` to run a different selection, e.g.
+    ``nox -s parallel -- lint mypy``.
+    """
+    targets = session.posargs or [f"tests-{python}" for python in PYTHON_VERSIONS]
+    jobs = min(len(targets), os.cpu_count() or 1)
+
+    # Provision virtualenvs with limited concurrency, then run all sessions
+    # fully in parallel without touching pip again
+    failed = _run_sessions_parallel(
+        targets, ["--install-only"], min(jobs, MAX_PARALLEL_INSTALLS)
+    )
+    if not failed:
+        failed = _run_sessions_parallel(targets, ["-R"], jobs)
+
+    if failed:
+        session.error(f"Sessions failed: {', '.join(failed)}")
@@ -7,10 +7,15 @@ __version__ = "0.1.0"
 __author__ = "Jörn Preuß"
 __email__ = "joern.preuss@gmail.com"
 
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
 from .config import get_config, reload_config
-from .plugin import requirements, show_requirements_coverage_rich
 from .requirements import RequirementsParser
 
+if TYPE_CHECKING:
+    from .plugin import show_requirements_coverage_rich
+
 __all__ = [
     "get_config",
     "reload_config",
@@ -18,3 +23,24 @@ __all__ = [
     "show_requirements_coverage_rich",
     "RequirementsParser",
 ]
+
+# Names from .plugin are resolved on first use so that importing pytreqt does
+# not pull in pytest and rich.
+
+
+def requirements(*reqs: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator to explicitly mark tests with requirements.
+
+    See :func:`pytreqt.plugin.requirements`.
+    """
+    from .plugin import requirements as plugin_requirements
+
+    return plugin_requirements(*reqs)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "show_requirements_coverage_rich":
+        from .plugin import show_requirements_coverage_rich
+
+        return show_requirements_coverage_rich
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,27 @@
 """CLI entry point for pytreqt."""
 
+from typing import Any
+
 import click
 from click.core import Context
 
-from .plugin import show_requirements_coverage_rich
-
 
 class OrderedGroup(click.Group):
     """Click group that preserves command order."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._ordered_names: list[str] = list(self.commands)
+
+    def add_command(self, cmd: click.Command, name: str | None = None) -> None:
+        super().add_command(cmd, name)
+        name = name or cmd.name
+        if name is not None and name not in self._ordered_names:
+            self._ordered_names.append(name)
+
     def list_commands(self, ctx: Context) -> list[str]:
-        return list(self.commands.keys())
+        # Click only reads this list, so it is returned without copying
+        return self._ordered_names
 
 
 @click.group(cls=OrderedGroup)
@@ -67,6 +78,8 @@ def coverage() -> None:
 @click.help_option("-h", "--help")
 def show() -> None:
     """Show requirements coverage from last test run"""
+    from .plugin import show_requirements_coverage_rich
+
     show_requirements_coverage_rich()
 
 
@@ -95,12 +108,18 @@ def changes() -> None:
 
 
 @cli.command()
+@click.option(
+    "--in-process",
+    is_flag=True,
+    help="Run tests in this process instead of a pytest subprocess "
+    "(faster, but without isolation from pytreqt's own imports)",
+)
 @click.help_option("-h", "--help")
-def update() -> None:
+def update(in_process: bool) -> None:
     """Update all traceability artifacts"""
     from .tools.update import main as update_main
 
-    update_main()
+    update_main(in_process=in_process)
 
 
 def main() -> None:
@@ -1,19 +1,109 @@
 """Configuration management for pytreqt."""
 
 import os
+import re
 import sys
+from collections import ChainMap
+from collections.abc import Callable, Mapping
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 if sys.version_info >= (3, 11):
     import tomllib as _toml_lib
 else:
     import tomli as _toml_lib
 
+# Default configuration, shared read-only by all instances. User settings are
+# stored separately and layered on top when looked up.
+_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        "requirements_file": "spec/requirements.md",
+        "requirement_patterns": [
+            r"FR-\d+\.?\d*",  # Functional Requirements
+            r"BR-\d+\.?\d*",  # Business Rules
+        ],
+        "cache_dir": ".pytest_cache",
+        "output_formats": ["markdown", "json", "csv"],
+        "database": MappingProxyType(
+            {
+                "detect_from_env": ["TEST_DATABASE", "DATABASE_URL", "DB_TYPE"],
+                "default_type": "SQLite",
+            }
+        ),
+        "reports": MappingProxyType(
+            {
+                "output_dir": ".",
+                "template_dir": "templates",
+                "coverage_filename": "TEST_COVERAGE.md",
+            }
+        ),
+    }
+)
+
+# Substrings of database environment values mapped to database type names
+_DATABASE_TYPES = {
+    "postgres": "PostgreSQL",
+    "mysql": "MySQL",
+    "sqlite": "SQLite",
+}
+
+
+@lru_cache(maxsize=8)
+def _parse_toml(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a TOML file, reusing the result until its mtime changes.
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    with open(path_str, "rb") as f:
+        return _toml_lib.load(f)
+
+
+def _find_config_file(config_path: str | Path | None = None) -> Path | None:
+    """Get the specified config file or search for one."""
+    if config_path:
+        return Path(config_path)
+
+    # Search for config files in order of preference
+    search_paths = [
+        Path("pytreqt.toml"),
+        Path("pyproject.toml"),
+    ]
+    for path in search_paths:
+        if path.exists():
+            return path
+    return None
+
 
 class PytreqtConfig:
     """Configuration manager for pytreqt."""
 
+    # Settings exposed as attributes: name -> (config key path, converter).
+    # They are resolved by __getattr__ on first access and then stored on the
+    # instance, so later reads are plain attribute lookups.
+    _ATTR_MAP: ClassVar[dict[str, tuple[tuple[str, ...], Callable[[Any], Any]]]] = {
+        "requirements_file": (("requirements_file",), Path),
+        "requirement_patterns": (("requirement_patterns",), list),
+        "cache_dir": (("cache_dir",), Path),
+        "output_formats": (("output_formats",), list),
+        "database_detect_env_vars": (("database", "detect_from_env"), list),
+        "database_default_type": (("database", "default_type"), str),
+        "reports_output_dir": (("reports", "output_dir"), Path),
+        "reports_template_dir": (("reports", "template_dir"), Path),
+        "coverage_filename": (("reports", "coverage_filename"), str),
+    }
+
+    requirements_file: Path  # Requirements file path
+    requirement_patterns: list[str]  # Requirement ID patterns
+    cache_dir: Path  # Cache directory path
+    output_formats: list[str]  # Supported output formats
+    database_detect_env_vars: list[str]  # Env vars checked for database type
+    database_default_type: str  # Default database type
+    reports_output_dir: Path  # Reports output directory
+    reports_template_dir: Path  # Reports template directory
+    coverage_filename: str  # Coverage report filename
+
     def __init__(self, config_path: str | Path | None = None):
         """Initialize configuration.
 
@@ -22,49 +112,25 @@ class PytreqtConfig:
                 for config files.
         """
         self._config: dict[str, Any] = {}
+        self._requirement_regex: re.Pattern[str] | None = None
         self._load_config(config_path)
 
     def _load_config(self, config_path: str | Path | None = None) -> None:
         """Load configuration from file(s)."""
-        # Set defaults first
-        self._config = {
-            "requirements_file": "spec/requirements.md",
-            "requirement_patterns": [
-                r"FR-\d+\.?\d*",  # Functional Requirements
-                r"BR-\d+\.?\d*",  # Business Rules
-            ],
-            "cache_dir": ".pytest_cache",
-            "output_formats": ["markdown", "json", "csv"],
-            "database": {
-                "detect_from_env": ["TEST_DATABASE", "DATABASE_URL", "DB_TYPE"],
-                "default_type": "SQLite",
-            },
-            "reports": {
-                "output_dir": ".",
-                "template_dir": "templates",
-                "coverage_filename": "TEST_COVERAGE.md",
-            },
-        }
+        # Only user settings are stored; defaults are looked up in _DEFAULTS
+        self._config = {}
 
-        # Try to load from specified config file or search for config files
-        config_file = None
-        if config_path:
-            config_file = Path(config_path)
-        else:
-            # Search for config files in order of preference
-            search_paths = [
-                Path("pytreqt.toml"),
-                Path("pyproject.toml"),
-            ]
-            for path in search_paths:
-                if path.exists():
-                    config_file = path
-                    break
+        # Drop values cached from a previous load
+        self._requirement_regex = None
+        for name in (*self._ATTR_MAP, "_database_env", "database_type"):
+            self.__dict__.pop(name, None)
 
+        config_file = _find_config_file(config_path)
         if config_file and config_file.exists():
             try:
-                with open(config_file, "rb") as f:
-                    file_config = _toml_lib.load(f)
+                file_config = _parse_toml(
+                    str(config_file.resolve()), config_file.stat().st_mtime_ns
+                )
 
                 # Extract pytreqt config from pyproject.toml or use entire file
                 # for pytreqt.toml
@@ -73,107 +139,130 @@ class PytreqtConfig:
                 else:
                     pytreqt_config = file_config
 
-                # Merge with defaults
-                self._merge_config(pytreqt_config)
+                self._config = pytreqt_config
 
             except (OSError, _toml_lib.TOMLDecodeError) as e:
                 # Fall back to defaults if config file is unreadable
                 print(f"Warning: Could not read config file {config_file}: {e}")
 
-    def _merge_config(self, new_config: dict[str, Any]) -> None:
-        """Merge new configuration with existing configuration."""
-        for key, value in new_config.items():
-            if (
-                key in self._config
-                and isinstance(self._config[key], dict)
-                and isinstance(value, dict)
-            ):
-                # Deep merge for nested dictionaries
-                self._config[key].update(value)
-            else:
-                self._config[key] = value
+    def __getattr__(self, name: str) -> Any:
+        """Resolve a setting from _ATTR_MAP and cache it on the instance."""
+        try:
+            keys, convert = self._ATTR_MAP[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
 
-    @property
-    def requirements_file(self) -> Path:
-        """Get the requirements file path."""
-        return Path(self._config["requirements_file"])
+        if len(keys) == 1:
+            value = self._config.get(keys[0], _DEFAULTS[keys[0]])
+        else:
+            value = self._section(keys[0])[keys[1]]
 
-    @property
-    def requirement_patterns(self) -> list[str]:
-        """Get the requirement ID patterns."""
-        return self._config["requirement_patterns"]
+        value = convert(value)
+        self.__dict__[name] = value
+        return value
 
-    @property
-    def cache_dir(self) -> Path:
-        """Get the cache directory path."""
-        return Path(self._config["cache_dir"])
+    def _section(self, name: str) -> Mapping[str, Any]:
+        """Get a nested config section with user settings over defaults."""
+        overrides = self._config.get(name)
+        if not overrides:
+            # Common case without user settings: no layering needed
+            return _DEFAULTS[name]
+        return ChainMap(overrides, _DEFAULTS[name])
 
     @property
-    def output_formats(self) -> list[str]:
-        """Get supported output formats."""
-        return self._config["output_formats"]
+    def requirement_regex(self) -> re.Pattern[str]:
+        """Get a single case-insensitive regex matching any requirement ID pattern.
 
-    @property
-    def database_detect_env_vars(self) -> list[str]:
-        """Get environment variables to check for database type detection."""
-        return self._config["database"]["detect_from_env"]
+        Scanning text once with this regex is equivalent to scanning it with
+        each pattern in turn. The alternation is available as ``.pattern`` for
+        embedding into larger expressions.
+        """
+        if self._requirement_regex is None:
+            alternation = "|".join(
+                f"(?:{pattern})" for pattern in self.requirement_patterns
+            )
+            # An empty alternation would match everywhere; never match instead
+            self._requirement_regex = re.compile(alternation or "(?!)", re.IGNORECASE)
+        return self._requirement_regex
 
-    @property
-    def database_default_type(self) -> str:
-        """Get the default database type."""
-        return self._config["database"]["default_type"]
+    @cached_property
+    def _database_env(self) -> dict[str, str]:
+        """Get lowercased values of the database detection environment variables.
 
-    @property
-    def reports_output_dir(self) -> Path:
-        """Get the reports output directory."""
-        return Path(self._config["reports"]["output_dir"])
+        The environment is read once per config instance.
+        """
+        env = os.environ
+        return {
+            env_var: env.get(env_var, "").lower()
+            for env_var in self.database_detect_env_vars
+        }
 
-    @property
-    def reports_template_dir(self) -> Path:
-        """Get the reports template directory."""
-        return Path(self._config["reports"]["template_dir"])
+    @cached_property
+    def database_type(self) -> str:
+        """Get the database type detected from environment variables."""
+        for value in self._database_env.values():
+            if value:
+                database_type = next(
+                    (name for key, name in _DATABASE_TYPES.items() if key in value),
+                    None,
+                )
+                if database_type:
+                    return database_type
 
-    @property
-    def coverage_filename(self) -> str:
-        """Get the coverage report filename."""
-        return self._config["reports"]["coverage_filename"]
+        return self.database_default_type
 
     def get_database_type(self) -> str:
         """Determine database type from environment variables."""
-        for env_var in self.database_detect_env_vars:
-            value = os.getenv(env_var)
-            if value:
-                # Common detection patterns
-                if "postgresql" in value.lower() or "postgres" in value.lower():
-                    return "PostgreSQL"
-                elif "mysql" in value.lower():
-                    return "MySQL"
-                elif "sqlite" in value.lower():
-                    return "SQLite"
-                elif env_var == "TEST_DATABASE" and value.lower() == "postgresql":
-                    return "PostgreSQL"
-
-        return self.database_default_type
+        return self.database_type
 
     def to_dict(self) -> dict[str, Any]:
         """Get the full configuration as a dictionary."""
-        return self._config.copy()
+        config = {**_DEFAULTS, **self._config}
+        for name in ("database", "reports"):
+            config[name] = dict(self._section(name))
+        return config
+
 
+# Config instances keyed by (resolved config file path, st_mtime_ns)
+_config_cache: dict[tuple[str, int], PytreqtConfig] = {}
 
-# Global config instance
+# Global config instance, returned by get_config() when no path is given
 _config: PytreqtConfig | None = None
 
 
+def _config_key(config_path: str | Path | None = None) -> tuple[str, int]:
+    """Identify a config file and its current version."""
+    config_file = _find_config_file(config_path)
+    if config_file is None:
+        return ("", 0)
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return (str(config_file.resolve()), mtime_ns)
+
+
 def get_config(config_path: str | Path | None = None) -> PytreqtConfig:
-    """Get the global configuration instance."""
+    """Get the global configuration instance.
+
+    Passing a config path makes that file's configuration the global one.
+    Configurations are cached per file, so repeated calls with the same
+    unchanged file return the same instance.
+    """
     global _config
     if _config is None or config_path is not None:
-        _config = PytreqtConfig(config_path)
+        key = _config_key(config_path)
+        if key not in _config_cache:
+            _config_cache[key] = PytreqtConfig(config_path)
+        _config = _config_cache[key]
     return _config
 
 
 def reload_config(config_path: str | Path | None = None) -> PytreqtConfig:
     """Reload the configuration."""
     global _config
-    _config = PytreqtConfig(config_path)
+    _config_cache.clear()
+    _config = _config_cache[_config_key(config_path)] = PytreqtConfig(config_path)
     return _config
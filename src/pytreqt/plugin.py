@@ -5,105 +5,220 @@ This plugin parses test docstrings for requirement references and can generate
 coverage reports showing which requirements are tested.
 """
 
-import getpass
-import json
 import os
-import platform
-import socket
-import subprocess
 import sys
 from collections import defaultdict
-from collections.abc import Callable, Generator
-from datetime import datetime
+from collections.abc import Callable, Generator, Iterator
+from functools import cache
+from pathlib import Path
 from typing import Any
 
 import pytest
-from _pytest.reports import TestReport
 from _pytest.terminal import TerminalReporter
-from rich.console import Console
 
 from .config import get_config
 from .requirements import RequirementsParser
 
+# orjson is an optional speedup for reading and writing the coverage cache
+try:
+    import orjson
+
+    def _dumps_json(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def _loads_json(data: bytes) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+
+    def _dumps_json(data: Any) -> bytes:
+        import json
+
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    def _loads_json(data: bytes) -> Any:
+        import json
+
+        return json.loads(data)
+
 
 class RequirementsCollector:
     """Collects requirements coverage from test docstrings."""
 
     def __init__(self) -> None:
-        self.test_requirements: dict[str, set[str]] = {}
-        self.requirement_tests: dict[str, list[str]] = defaultdict(list)
+        self.test_requirements: dict[str, frozenset[str]] = {}
+        self.requirement_tests: dict[str, set[str]] = defaultdict(set)
         self.test_results: dict[str, str] = {}  # Track test outcomes
+        self.show_docstrings = False  # Set from --show-docstrings in configure
         self.parser = RequirementsParser()
         self.config = get_config()
+        # Requirements per docstring; parametrized tests share one
+        self._doc_cache: dict[str, frozenset[str]] = {}
+        # Node IDs of all tests seen, including those without requirements
+        self.collected_tests: set[str] = set()
+
+    def _docstring_requirements(self, docstring: str) -> frozenset[str]:
+        """Extract the requirements of a docstring, with caching."""
+        requirements = self._doc_cache.get(docstring)
+        if requirements is None:
+            requirements = frozenset(self.parser.extract_requirements(docstring))
+            self._doc_cache[docstring] = requirements
+        return requirements
 
     def collect_test_requirements(self, item: pytest.Item) -> None:
-        """Collect requirements from a test item's docstring."""
+        """Collect requirements from a test item's docstring.
+
+        The requirements are validated later, for all tests at once, by
+        validate_requirements().
+        """
+        self.collected_tests.add(item.nodeid)
         if hasattr(item, "function") and item.function.__doc__:  # type: ignore[attr-defined]
-            requirements = self.parser.extract_requirements(item.function.__doc__)  # type: ignore[attr-defined]
+            requirements = self._docstring_requirements(item.function.__doc__)  # type: ignore[attr-defined]
             if requirements:
-                # Validate requirements exist in requirements file
-                self.parser.validate_requirements(requirements, item.nodeid)
-
                 # Use item.nodeid for consistency with test result capture
                 test_name = item.nodeid
                 self.test_requirements[test_name] = requirements
 
                 for req in requirements:
-                    self.requirement_tests[req].append(test_name)
+                    self.requirement_tests[req].add(test_name)
+
+    def validate_requirements(self) -> None:
+        """Validate that all collected requirements exist in the requirements file.
+
+        Raises:
+            ValueError: If any test references requirements not found in the
+                requirements file, listing all such tests
+        """
+        valid_requirements = self.parser.load_valid_requirements()
+        if not valid_requirements:
+            # If no requirements file found, don't validate
+            return
+
+        invalid_requirements = self.requirement_tests.keys() - valid_requirements
+        if not invalid_requirements:
+            return
+
+        invalid_by_test: dict[str, list[str]] = defaultdict(list)
+        for req in sorted(invalid_requirements):
+            for test in self.requirement_tests[req]:
+                invalid_by_test[test].append(req)
+        details = "\n".join(
+            f"  {test}: {', '.join(reqs)}"
+            for test, reqs in sorted(invalid_by_test.items())
+        )
+        raise ValueError(
+            f"Tests reference invalid requirements:\n{details}\n"
+            + f"Valid requirements are defined in {self.config.requirements_file}"
+        )
+
+    def sorted_requirements(self) -> list[str]:
+        """Get all requirements covered by collected tests, sorted."""
+        return sorted(set().union(*self.test_requirements.values()))
+
+    def worker_data(self) -> list[tuple[str, tuple[str, ...], str | None]]:
+        """Get the collected data in a compact form xdist can send to the master.
+
+        Returns:
+            One (test node ID, requirements, outcome) row per test with
+            requirements; the outcome is None for tests this worker did not run
+        """
+        results = self.test_results
+        return [
+            (test, tuple(reqs), results.get(test))
+            for test, reqs in self.test_requirements.items()
+        ]
+
+    def merge_worker_data(
+        self, rows: list[tuple[str, tuple[str, ...], str | None]]
+    ) -> None:
+        """Merge data sent by an xdist worker into this collector."""
+        for test, reqs, outcome in rows:
+            # Every worker collects all items, so skip tests already merged
+            if test not in self.test_requirements:
+                self.test_requirements[test] = frozenset(reqs)
+                for req in reqs:
+                    self.requirement_tests[req].add(test)
+            if outcome is not None:
+                self.test_results[test] = outcome
 
 
 # Global collector instance
 requirements_collector = RequirementsCollector()
 
-
-# Remove pytest_configure_node - not a standard pytest hook
-# Worker node configuration handled through other mechanisms
+# xdist sets this before a worker loads its plugins
+_IS_XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER") is not None
+
+# Environment variables recorded with the coverage cache
+# Command line recorded in the cache when pytest is not run from the shell
+COMMAND_ENV_VAR = "PYTREQT_COMMAND"
+
+_RELEVANT_ENV_VARS = (
+    "TEST_DATABASE",
+    "DATABASE_URL",
+    "PYTEST_XDIST_WORKER",
+    "CI",
+    "GITHUB_ACTIONS",
+    "VIRTUAL_ENV",
+    "CONDA_DEFAULT_ENV",
+)
+
+# Status symbol and color per test result
+_RESULT_SYMBOLS = {
+    "passed": ("✓", "green"),
+    "failed": ("✗", "red"),
+    "skipped": ("⊝", "yellow"),
+}
+_UNKNOWN_SYMBOL = ("?", "purple")
+
+
+def _markup_symbols(terminalreporter: TerminalReporter) -> dict[str, str]:
+    """Get the status symbols for a terminal, marked up once per report.
+
+    Returns:
+        Marked up status symbol per color in _RESULT_SYMBOLS/_UNKNOWN_SYMBOL
+    """
+    tw = terminalreporter._tw
+    return {
+        color: tw.markup(symbol, **{color: True})
+        for symbol, color in (*_RESULT_SYMBOLS.values(), _UNKNOWN_SYMBOL)
+    }
 
 
-# Remove pytest_testnodedown - not a standard pytest hook
-# Worker communication handled through other mechanisms
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Hook called at end of session - xdist workers send their data to master."""
+    if _IS_XDIST_WORKER:
+        workeroutput = getattr(session.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput["pytreqt"] = requirements_collector.worker_data()
 
 
-def pytest_runtest_logreport(report: TestReport) -> None:
-    """Called for each test report - runs on workers, sends data to master."""
-    # Only handle the main test call
-    if report.when == "call" and hasattr(report, "nodeid"):
-        # Get requirements for this test
-        test_name = report.nodeid
-        if test_name in requirements_collector.test_requirements:
-            # Send requirements data to master via the report
-            requirements = requirements_collector.test_requirements[test_name]
-            if not hasattr(report, "_requirements_data"):
-                report._requirements_data = {  # type: ignore[attr-defined]
-                    "test_requirements": {test_name: requirements},
-                    "requirement_tests": {},
-                    "test_results": {test_name: report.outcome},
-                }
-                # Build requirement_tests mapping
-                req_data = report._requirements_data  # type: ignore[attr-defined]
-                for req in requirements:
-                    if req not in req_data["requirement_tests"]:
-                        req_data["requirement_tests"][req] = []
-                    req_data["requirement_tests"][req].append(test_name)
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any, error: Any) -> None:
+    """Hook called on xdist master when a worker finishes - merge its data."""
+    data = getattr(node, "workeroutput", {}).get("pytreqt")
+    if data:
+        requirements_collector.merge_worker_data(data)
 
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_runtest_setup(item: pytest.Item) -> None:
     """Hook called before each test runs - collect requirements."""
-    requirements_collector.collect_test_requirements(item)
+    # Items are normally collected in pytest_collection_modifyitems already
+    if item.nodeid not in requirements_collector.collected_tests:
+        requirements_collector.collect_test_requirements(item)
+        # Only validate again if the test added requirement references
+        if item.nodeid in requirements_collector.test_requirements:
+            requirements_collector.validate_requirements()
 
     # Show docstring if flag is set
-    if (
-        item.config.getoption("--show-docstrings")
-        and hasattr(item, "function")
-        and item.function.__doc__  # type: ignore[attr-defined]
-    ):
-        item.config.hook.pytest_runtest_logstart(
-            nodeid=item.nodeid, location=item.location
-        )
-        if hasattr(item, "function"):
-            print(f"\n{item.function.__doc__.strip()}")  # type: ignore[attr-defined]
-        print("-" * 40)
+    if requirements_collector.show_docstrings and hasattr(item, "function"):
+        docstring = (item.function.__doc__ or "").strip()  # type: ignore[attr-defined]
+        if docstring:
+            item.config.hook.pytest_runtest_logstart(
+                nodeid=item.nodeid, location=item.location
+            )
+            print(f"\n{docstring}")
+            print("-" * 40)
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -131,52 +246,14 @@ def pytest_terminal_summary(
         _display_cached_coverage(terminalreporter)
         return
 
-    is_xdist_worker = os.getenv("PYTEST_XDIST_WORKER") is not None
-
-    # Initialize aggregated data containers
-    aggregated_test_requirements: dict[str, set[str]] = {}
-    aggregated_requirement_tests: dict[str, list[str]] = defaultdict(list)
-    aggregated_test_results: dict[str, str] = {}
-
-    # For xdist master process, collect data from all test reports
-    if not is_xdist_worker:
-        # Check if we have reports with requirements data
-        if hasattr(terminalreporter, "stats"):
-            for category in ["passed", "failed", "skipped"]:
-                if category in terminalreporter.stats:
-                    for report in terminalreporter.stats[category]:
-                        if hasattr(report, "_requirements_data"):
-                            data = report._requirements_data  # type: ignore[attr-defined]
-                            aggregated_test_requirements.update(
-                                data["test_requirements"]
-                            )
-                            aggregated_test_results.update(data["test_results"])
-                            for req, tests in data["requirement_tests"].items():
-                                for test in tests:
-                                    if test not in aggregated_requirement_tests[req]:
-                                        aggregated_requirement_tests[req].append(test)
-
-        # If we have aggregated data, temporarily set it in the collector
-        if aggregated_test_requirements:
-            original_test_requirements = requirements_collector.test_requirements
-            original_requirement_tests = requirements_collector.requirement_tests
-            original_test_results = requirements_collector.test_results
-
-            requirements_collector.test_requirements = aggregated_test_requirements
-            requirements_collector.requirement_tests = defaultdict(
-                list, aggregated_requirement_tests
-            )
-            requirements_collector.test_results = aggregated_test_results
-
-            _save_coverage_data()
+    # Shared by the saved cache and the report below
+    all_requirements = requirements_collector.sorted_requirements()
 
-            # Restore original data
-            requirements_collector.test_requirements = original_test_requirements
-            requirements_collector.requirement_tests = original_requirement_tests
-            requirements_collector.test_results = original_test_results
-        elif requirements_collector.test_requirements:
-            # Fallback for single-threaded execution
-            _save_coverage_data()
+    # On xdist master the collector holds the data merged from all workers
+    if not _IS_XDIST_WORKER:
+        report_json = config.getoption("--requirements-report-json")
+        if requirements_collector.test_requirements or report_json:
+            _save_coverage_data(all_requirements, report_json)
 
     # Check if verbose mode or custom flag is set
     verbose_level = terminalreporter.config.getoption("verbose")
@@ -185,58 +262,35 @@ def pytest_terminal_summary(
     ):
         terminalreporter.section("Requirements Coverage")
 
-        # Use aggregated data if available, otherwise use collector data
-        test_requirements = (
-            aggregated_test_requirements
-            if "aggregated_test_requirements" in locals()
-            and aggregated_test_requirements
-            else requirements_collector.test_requirements
-        )
-        requirement_tests = (
-            aggregated_requirement_tests
-            if "aggregated_requirement_tests" in locals()
-            and aggregated_requirement_tests
-            else requirements_collector.requirement_tests
-        )
-        test_results = (
-            aggregated_test_results
-            if "aggregated_test_results" in locals() and aggregated_test_results
-            else requirements_collector.test_results
-        )
+        test_requirements = requirements_collector.test_requirements
+        requirement_tests = requirements_collector.requirement_tests
+        test_results = requirements_collector.test_results
 
-        # Show tests grouped by requirements
-        all_requirements: set[str] = set()
-        for reqs in test_requirements.values():
-            all_requirements.update(reqs)
+        marked_symbols = _markup_symbols(terminalreporter)
 
-        for req in sorted(all_requirements):
-            tests = requirement_tests[req]
-            terminalreporter.write_line(f"  {req}:")
+        # Show tests grouped by requirements, written out in one go
+        lines: list[str] = []
+        for req in all_requirements:
+            tests = sorted(requirement_tests[req])
+            lines.append(f"  {req}:")
             for test in tests:
                 # Extract just the test function name for brevity
-                short_name = test.split("::")[-1]
+                short_name = test.rpartition("::")[2]
 
                 # Get test result and show appropriate status
                 result = test_results.get(test, "unknown")
-                if result == "passed":
-                    symbol = terminalreporter._tw.markup("✓", green=True)
-                elif result == "failed":
-                    symbol = terminalreporter._tw.markup("✗", red=True)
-                elif result == "skipped":
-                    symbol = terminalreporter._tw.markup("⊝", yellow=True)
-                else:
-                    symbol = terminalreporter._tw.markup("?", purple=True)
-
-                terminalreporter.write_line(f"    {symbol} {short_name}")
+                _, color = _RESULT_SYMBOLS.get(result, _UNKNOWN_SYMBOL)
+                lines.append(f"    {marked_symbols[color]} {short_name}")
 
         # Summary statistics
         total_tests = len(test_requirements)
         total_requirements = len(all_requirements)
 
-        terminalreporter.write_line("")
-        terminalreporter.write_line("Requirements Coverage Summary:")
-        terminalreporter.write_line(f"  Tests with requirements: {total_tests}")
-        terminalreporter.write_line(f"  Requirements covered: {total_requirements}")
+        lines.append("")
+        lines.append("Requirements Coverage Summary:")
+        lines.append(f"  Tests with requirements: {total_tests}")
+        lines.append(f"  Requirements covered: {total_requirements}")
+        terminalreporter.write_line("\n".join(lines))
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -247,6 +301,12 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="Show requirements coverage report even without verbose mode",
     )
+    parser.addoption(
+        "--requirements-report-json",
+        metavar="PATH",
+        default=None,
+        help="Write requirements coverage data as JSON to PATH",
+    )
     parser.addoption(
         "--requirements-only",
         action="store_true",
@@ -291,6 +351,11 @@ def pytest_collection_modifyitems(
             item.add_marker(skip_marker)
 
 
+def pytest_collection_finish(session: pytest.Session) -> None:
+    """Hook called after collection - validate all requirement references."""
+    requirements_collector.validate_requirements()
+
+
 # Custom marker for requirements
 def pytest_configure(config: pytest.Config) -> None:
     """Register custom markers."""
@@ -299,6 +364,9 @@ def pytest_configure(config: pytest.Config) -> None:
         "requirements(fr_list, br_list): mark test with specific requirements",
     )
 
+    # Read once here instead of for every test in pytest_runtest_setup
+    requirements_collector.show_docstrings = config.getoption("--show-docstrings")
+
 
 def requirements(*reqs: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator to explicitly mark tests with requirements.
@@ -333,76 +401,101 @@ def requirements(*reqs: str) -> Callable[[Callable[..., Any]], Callable[..., Any
     return decorator
 
 
-def _save_coverage_data() -> None:
-    """Save current requirements coverage data to cache file (single worker)."""
+def _git_info() -> dict[str, str | bool]:
+    """Get branch, commit and working tree state of the current git checkout.
+
+    Uses a single ``git status --porcelain=v2 --branch`` call, which reports
+    the branch and HEAD commit in its header lines followed by one line per
+    changed file.
+    """
+    import subprocess
+
+    error: dict[str, str | bool] = {
+        "error": "Git not available or not a git repository"
+    }
+    try:
+        output = subprocess.check_output(
+            ["git", "status", "--porcelain=v2", "--branch"],
+            cwd=os.getcwd(),
+            stderr=subprocess.DEVNULL,
+        ).decode()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return error
+
+    headers: dict[str, str] = {}
+    clean = True
+    for line in output.splitlines():
+        if line.startswith("# "):
+            key, _, value = line[2:].partition(" ")
+            headers[key] = value
+        elif line:
+            clean = False
+
+    commit = headers.get("branch.oid", "(initial)")
+    if commit == "(initial)":
+        # No commits yet, HEAD cannot be resolved
+        return error
+
+    branch = headers.get("branch.head", "")
+    return {
+        # Detached HEAD has no current branch
+        "branch": "" if branch == "(detached)" else branch,
+        "commit": commit,
+        "commit_short": commit[:8],
+        "clean": clean,
+    }
+
+
+@cache
+def _platform_info() -> dict[str, str]:
+    """Get platform details, computed once per process on first use."""
+    import platform
+
+    return {
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "python_version": platform.python_version(),
+    }
+
+
+def _save_coverage_data(
+    all_requirements: list[str] | None = None, report_json: str | None = None
+) -> None:
+    """Save current requirements coverage data to cache file (single worker).
+
+    Args:
+        all_requirements: Sorted covered requirements, if already computed
+        report_json: Additional path to write the coverage data to, from
+            --requirements-report-json
+    """
+    import getpass
+    import socket
+    from datetime import datetime
+
     config = get_config()
     cache_dir = config.cache_dir
     cache_dir.mkdir(exist_ok=True)
 
     # Prepare coverage data
-    all_requirements = set()
-    for reqs in requirements_collector.test_requirements.values():
-        all_requirements.update(reqs)
+    if all_requirements is None:
+        all_requirements = requirements_collector.sorted_requirements()
 
     # Determine database type from environment
     database_type = config.get_database_type()
 
     # Get comprehensive execution context
-    pytest_command = " ".join(sys.argv)
+    pytest_command = os.environ.get(COMMAND_ENV_VAR) or " ".join(sys.argv)
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # Get git information
-    git_info: dict[str, str | bool] = {}
-    try:
-        git_info["branch"] = (
-            subprocess.check_output(
-                ["git", "branch", "--show-current"],
-                cwd=os.getcwd(),
-                stderr=subprocess.DEVNULL,
-            )
-            .decode()
-            .strip()
-        )
-
-        git_info["commit"] = (
-            subprocess.check_output(
-                ["git", "rev-parse", "HEAD"], cwd=os.getcwd(), stderr=subprocess.DEVNULL
-            )
-            .decode()
-            .strip()
-        )
-
-        git_info["commit_short"] = git_info["commit"][:8]  # type: ignore[index]
-
-        # Check if working directory is clean
-        git_status = (
-            subprocess.check_output(
-                ["git", "status", "--porcelain"],
-                cwd=os.getcwd(),
-                stderr=subprocess.DEVNULL,
-            )
-            .decode()
-            .strip()
-        )
-        git_info["clean"] = len(git_status) == 0
-
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        git_info = {"error": "Git not available or not a git repository"}
+    git_info = _git_info()
 
     # Capture relevant environment variables
-    env_vars = {}
-    relevant_env_vars = [
-        "TEST_DATABASE",
-        "DATABASE_URL",
-        "PYTEST_XDIST_WORKER",
-        "CI",
-        "GITHUB_ACTIONS",
-        "VIRTUAL_ENV",
-        "CONDA_DEFAULT_ENV",
-    ]
-    for var in relevant_env_vars:
-        if var in os.environ:
-            env_vars[var] = os.environ[var]
+    env = os.environ
+    env_vars = {
+        var: value for var in _RELEVANT_ENV_VARS if (value := env.get(var)) is not None
+    }
 
     coverage_data = {
         "command_info": {
@@ -412,12 +505,7 @@ def _save_coverage_data() -> None:
             "working_directory": os.getcwd(),
             "user": getpass.getuser(),
             "hostname": socket.gethostname(),
-            "platform": {
-                "system": platform.system(),
-                "release": platform.release(),
-                "machine": platform.machine(),
-                "python_version": platform.python_version(),
-            },
+            "platform": _platform_info(),
             "environment_variables": env_vars,
             "git": git_info,
         },
@@ -431,175 +519,125 @@ def _save_coverage_data() -> None:
     # Store requirements with their tests and results
     requirements_dict = coverage_data["requirements"]
     assert isinstance(requirements_dict, dict)
-    for req in sorted(all_requirements):
-        tests = requirements_collector.requirement_tests[req]
+    for req in all_requirements:
+        tests = sorted(requirements_collector.requirement_tests[req])
         requirements_dict[req] = []
 
         for test in tests:
-            short_name = test.split("::")[-1]
+            short_name = test.rpartition("::")[2]
             result = requirements_collector.test_results.get(test, "unknown")
             req_data: list[dict[str, str]] = requirements_dict[req]
             req_data.append(
                 {"test_name": short_name, "full_name": test, "result": result}
             )
 
-    # Save to cache file
-    cache_file = cache_dir / "requirements_coverage.json"
-    with open(cache_file, "w", encoding="utf-8") as f:
-        json.dump(coverage_data, f, indent=2)
+    data = _dumps_json(coverage_data)
+    if report_json:
+        Path(report_json).write_bytes(data)
 
+    # Save to cache file, unless there is nothing to show from this run
+    if requirements_collector.test_requirements:
+        cache_file = cache_dir / "requirements_coverage.json"
+        cache_file.write_bytes(data)
 
-def _display_cached_coverage(terminalreporter: TerminalReporter) -> None:
-    """Display requirements coverage from cached data."""
-    config = get_config()
-    cache_file = config.cache_dir / "requirements_coverage.json"
 
+def _load_cached_coverage() -> tuple[dict[str, Any] | None, str]:
+    """Load the requirements coverage cached by the last test run.
+
+    Returns:
+        Tuple of (coverage data, error message); the data is None on error
+    """
+    cache_file = get_config().cache_dir / "requirements_coverage.json"
     if not cache_file.exists():
-        terminalreporter.write_line(
-            "No cached requirements coverage found. Run tests first.", red=True
-        )
-        return
+        return None, "No cached requirements coverage found. Run tests first."
 
     try:
-        with open(cache_file, encoding="utf-8") as f:
-            coverage_data = json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
-        terminalreporter.write_line(f"Error reading cached coverage: {e}", red=True)
-        return
+        return _loads_json(cache_file.read_bytes()), ""
+    except (ValueError, OSError) as e:
+        return None, f"Error reading cached coverage: {e}"
 
-    terminalreporter.section("Requirements Coverage (Last Run)")
 
-    # Show command info
+def _iter_rows(coverage_data: dict[str, Any]) -> Iterator[tuple[str, str, str]]:
+    """Yield the lines of a cached requirements coverage report.
+
+    Yields:
+        (style, symbol, text) tuples. Test rows have the status symbol and its
+        color as style; other rows have no symbol and a style that plain
+        renderers may ignore.
+    """
+    # Command info
     command_info = coverage_data.get("command_info", {})
     if command_info:
-        terminalreporter.write_line(
-            f"Database: {command_info.get('database', 'unknown')}"
-        )
-        terminalreporter.write_line(
-            f"Generated: {command_info.get('timestamp', 'unknown')}"
-        )
-        terminalreporter.write_line(
-            f"Command: {command_info.get('command', 'unknown')}"
-        )
+        yield "dim", "", f"Database: {command_info.get('database', 'unknown')}"
+        yield "dim", "", f"Generated: {command_info.get('timestamp', 'unknown')}"
+        yield "dim", "", f"Command: {command_info.get('command', 'unknown')}"
 
         git_info = command_info.get("git", {})
         if "error" not in git_info and git_info:
             branch = git_info.get("branch", "unknown")
             commit_short = git_info.get("commit_short", "unknown")
             clean_status = "clean" if git_info.get("clean", False) else "dirty"
-            terminalreporter.write_line(
-                f"Git: {branch}@{commit_short} ({clean_status})"
-            )
+            yield "dim", "", f"Git: {branch}@{commit_short} ({clean_status})"
 
         env_vars = command_info.get("environment_variables", {})
         if env_vars:
             env_str = ", ".join(f"{k}={v}" for k, v in env_vars.items())
-            terminalreporter.write_line(f"Environment: {env_str}")
+            yield "dim", "", f"Environment: {env_str}"
 
-        terminalreporter.write_line("")
+        yield "", "", ""
 
-    # Display requirements and their tests
+    # Requirements and their tests
     for req in sorted(coverage_data["requirements"].keys()):
-        tests = coverage_data["requirements"][req]
-        terminalreporter.write_line(f"  {req}:")
-
-        for test_info in tests:
-            result = test_info["result"]
-            if result == "passed":
-                symbol = terminalreporter._tw.markup("✓", green=True)
-            elif result == "failed":
-                symbol = terminalreporter._tw.markup("✗", red=True)
-            elif result == "skipped":
-                symbol = terminalreporter._tw.markup("⊝", yellow=True)
-            else:
-                symbol = terminalreporter._tw.markup("?", purple=True)
-
-            terminalreporter.write_line(f"    {symbol} {test_info['test_name']}")
+        yield "white", "", f"  {req}:"
+        for test_info in coverage_data["requirements"][req]:
+            symbol, color = _RESULT_SYMBOLS.get(test_info["result"], _UNKNOWN_SYMBOL)
+            yield color, symbol, test_info["test_name"]
 
     # Summary statistics
     summary = coverage_data["summary"]
-    terminalreporter.write_line("")
-    terminalreporter.write_line("Requirements Coverage Summary:")
-    terminalreporter.write_line(f"  Tests with requirements: {summary['total_tests']}")
+    yield "", "", ""
+    yield "cyan", "", "Requirements Coverage Summary:"
+    yield "", "", f"  Tests with requirements: {summary['total_tests']}"
+    yield "", "", f"  Requirements covered: {summary['total_requirements']}"
+
+
+def _display_cached_coverage(terminalreporter: TerminalReporter) -> None:
+    """Display requirements coverage from cached data."""
+    coverage_data, error = _load_cached_coverage()
+    if coverage_data is None:
+        terminalreporter.write_line(error, red=True)
+        return
+
+    terminalreporter.section("Requirements Coverage (Last Run)")
+
+    marked_symbols = _markup_symbols(terminalreporter)
     terminalreporter.write_line(
-        f"  Requirements covered: {summary['total_requirements']}"
+        "\n".join(
+            f"    {marked_symbols[style]} {text}" if symbol else text
+            for style, symbol, text in _iter_rows(coverage_data)
+        )
     )
 
 
 def show_requirements_coverage_rich() -> None:
     """Show requirements coverage from last test run using Rich formatting."""
+    from rich.console import Console
+    from rich.text import Text
+
     console = Console(force_terminal=True)
-    config = get_config()
 
     console.print("📋 Showing requirements coverage from last run...", style="cyan")
 
-    cache_file = config.cache_dir / "requirements_coverage.json"
-    if not cache_file.exists():
-        console.print(
-            "❌ No cached requirements coverage found. Run tests first.", style="red"
-        )
-        return
-
-    try:
-        with open(cache_file, encoding="utf-8") as f:
-            coverage_data = json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
-        console.print(f"❌ Error reading cached coverage: {e}", style="red")
+    coverage_data, error = _load_cached_coverage()
+    if coverage_data is None:
+        console.print(f"❌ {error}", style="red")
         return
 
     console.print("Requirements Coverage (Last Run)", style="green")
     console.print()
 
-    # Show command info
-    command_info = coverage_data.get("command_info", {})
-    if command_info:
-        console.print(
-            f"Database: {command_info.get('database', 'unknown')}", style="dim"
-        )
-        console.print(
-            f"Generated: {command_info.get('timestamp', 'unknown')}", style="dim"
-        )
-        console.print(f"Command: {command_info.get('command', 'unknown')}", style="dim")
-
-        git_info = command_info.get("git", {})
-        if "error" not in git_info and git_info:
-            branch = git_info.get("branch", "unknown")
-            commit_short = git_info.get("commit_short", "unknown")
-            clean_status = "clean" if git_info.get("clean", False) else "dirty"
-            console.print(f"Git: {branch}@{commit_short} ({clean_status})", style="dim")
-
-        env_vars = command_info.get("environment_variables", {})
-        if env_vars:
-            env_str = ", ".join(f"{k}={v}" for k, v in env_vars.items())
-            console.print(f"Environment: {env_str}", style="dim")
-
-        console.print()
-
-    # Display requirements and their tests
-    for req in sorted(coverage_data["requirements"].keys()):
-        tests = coverage_data["requirements"][req]
-        console.print(f"  {req}:", style="white")
-
-        for test_info in tests:
-            result = test_info["result"]
-            if result == "passed":
-                symbol = "✓"
-                color = "green"
-            elif result == "failed":
-                symbol = "✗"
-                color = "red"
-            elif result == "skipped":
-                symbol = "⊝"
-                color = "yellow"
-            else:
-                symbol = "?"
-                color = "purple"
-
-            console.print(f"    {symbol} {test_info['test_name']}", style=color)
-
-    # Summary statistics
-    summary = coverage_data["summary"]
-    console.print()
-    console.print("Requirements Coverage Summary:", style="cyan")
-    console.print(f"  Tests with requirements: {summary['total_tests']}")
-    console.print(f"  Requirements covered: {summary['total_requirements']}")
+    report = Text()
+    for style, symbol, text in _iter_rows(coverage_data):
+        line = f"    {symbol} {text}" if symbol else text
+        report.append(line + "\n", style=style)
+    console.print(report, end="")
@@ -1,6 +1,8 @@
 """Requirements parsing and validation logic for pytreqt."""
 
 import re
+import sys
+from collections.abc import Set as AbstractSet
 
 from .config import get_config
 
@@ -10,9 +12,18 @@ class RequirementsParser:
 
     def __init__(self) -> None:
         """Initialize the requirements parser."""
-        self._valid_requirements: set[str] | None = None
+        self._valid_requirements: frozenset[str] | None = None
         self.config = get_config()
 
+        # Single-pass regexes over all configured patterns
+        self._requirement_re = self.config.requirement_regex
+        # Requirement IDs in headers (## FR-1.1), bullet points (- **FR-1.1**)
+        # and bold format (**FR-1.1**)
+        self._definition_re = re.compile(
+            rf"(?:^|\s|-\s\*\*|\*\*)({self._requirement_re.pattern})",
+            re.MULTILINE | re.IGNORECASE,
+        )
+
     def extract_requirements(self, docstring: str) -> set[str]:
         """Extract requirements from docstring using configured patterns.
 
@@ -25,14 +36,13 @@ class RequirementsParser:
         if not docstring:
             return set()
 
-        requirements: set[str] = set()
-        for pattern in self.config.requirement_patterns:
-            matches = re.findall(pattern, docstring, re.IGNORECASE)
-            requirements.update(req.upper() for req in matches)
-
-        return requirements
+        # Interned, so the few distinct IDs are shared by all tests referencing them
+        return {
+            sys.intern(match.group().upper())
+            for match in self._requirement_re.finditer(docstring)
+        }
 
-    def load_valid_requirements(self) -> set[str]:
+    def load_valid_requirements(self) -> frozenset[str]:
         """Load valid requirement IDs from the requirements file.
 
         Returns:
@@ -43,31 +53,25 @@ class RequirementsParser:
 
         requirements_file = self.config.requirements_file
         if not requirements_file.exists():
-            self._valid_requirements = set()
+            self._valid_requirements = frozenset()
             return self._valid_requirements
 
         try:
             content = requirements_file.read_text(encoding="utf-8")
         except (OSError, UnicodeDecodeError):
-            self._valid_requirements = set()
+            self._valid_requirements = frozenset()
             return self._valid_requirements
 
         # Extract requirement IDs from markdown headers and bullet points
-        # This pattern looks for requirement IDs in common markdown formats
-        found_requirements: set[str] = set()
-        for pattern in self.config.requirement_patterns:
-            # Look for requirements in headers (## FR-1.1), bullet points
-            # (- **FR-1.1**), and bold format (**FR-1.1**)
-            combined_pattern = rf"(?:^|\s|-\s\*\*|\*\*)({pattern})"
-            matches = re.findall(
-                combined_pattern, content, re.MULTILINE | re.IGNORECASE
-            )
-            found_requirements.update(req.upper() for req in matches)
-
-        self._valid_requirements = found_requirements
+        self._valid_requirements = frozenset(
+            sys.intern(match.group(1).upper())
+            for match in self._definition_re.finditer(content)
+        )
         return self._valid_requirements
 
-    def validate_requirements(self, requirements: set[str], test_name: str) -> None:
+    def validate_requirements(
+        self, requirements: AbstractSet[str], test_name: str
+    ) -> None:
         """Validate that all requirements exist in the requirements file.
 
         Args:
@@ -77,6 +81,9 @@ class RequirementsParser:
         Raises:
             ValueError: If any requirements are not found in the requirements file
         """
+        if not requirements:
+            return
+
         valid_requirements = self.load_valid_requirements()
 
         if not valid_requirements:
@@ -5,16 +5,79 @@ Detect changes in requirements and identify affected tests.
 
 import hashlib
 import json
+import os
 import re
 import subprocess
 import sys
+import tempfile
 from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from ..config import get_config
 from .common import validate_requirements_file_exists
 
+# Version of the req_cache.json layout and hashing; caches of other versions
+# are ignored. Version 2 hashes individual requirements with BLAKE2s.
+CACHE_VERSION = 2
+
+# Directories never containing project sources relevant to a test run;
+# other hidden directories are skipped as well
+_SOURCE_EXCLUDE = frozenset(
+    {
+        "venv",
+        "env",
+        "node_modules",
+        "__pycache__",
+        "build",
+        "dist",
+        "htmlcov",
+    }
+)
+
+# Files whose configuration can change which tests run or pass, or which
+# requirements they reference
+_PYTEST_CONFIG_FILES = (
+    "pyproject.toml",
+    "pytest.ini",
+    "setup.cfg",
+    "tox.ini",
+    "pytreqt.toml",
+)
+
+
+def _sources_digest(root: Path) -> str:
+    """Hash the paths and modification times of the Python files under root.
+
+    Adding, removing, renaming or modifying a file, or touching the pytest
+    configuration, changes the digest.
+    """
+    entries = []
+    for dirpath, dirs, filenames in os.walk(root):
+        dirs[:] = [
+            d
+            for d in dirs
+            if d not in _SOURCE_EXCLUDE
+            and not d.startswith(".")
+            and not d.endswith(".egg-info")
+        ]
+        for name in filenames:
+            if name.endswith(".py") or (
+                dirpath == str(root) and name in _PYTEST_CONFIG_FILES
+            ):
+                path = os.path.join(dirpath, name)
+                try:
+                    mtime_ns = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                entries.append(f"{os.path.relpath(path, root)}\0{mtime_ns}")
+
+    digest = hashlib.sha256()
+    for entry in sorted(entries):
+        digest.update(entry.encode() + b"\n")
+    return digest.hexdigest()
+
 
 class RequirementChangeDetector:
     """Detects changes in requirements and identifies affected tests."""
@@ -24,55 +87,89 @@ class RequirementChangeDetector:
         if cache_file is None:
             cache_file = self.config.cache_dir / "req_cache.json"
         self.cache_file = Path(cache_file)
+        # Last test coverage mapping with the inputs it was obtained from
+        self.coverage_cache_file = self.config.cache_dir / "coverage_cache.json"
         self.requirements_file = self.config.requirements_file
+        # Single regex over all configured requirement ID patterns
+        self._description_re = re.compile(
+            rf"-\s+\*\*({self.config.requirement_regex.pattern})\*\*:\s+(.+)",
+            re.MULTILINE | re.IGNORECASE,
+        )
+        # Result of the pytest run in get_test_coverage_mapping, once obtained
+        self._coverage_mapping: dict[str, list[str]] | None = None
+        # (stat key, file hash, requirements) of the last read requirements file
+        self._parsed: tuple[tuple[int, int], str, dict[str, str]] | None = None
 
-    def get_requirements_hash(self) -> str | None:
-        """Calculate hash of requirements file content."""
-        if not self.requirements_file.exists():
+    def _stat_key(self) -> tuple[int, int] | None:
+        """Identify the requirements file version by modification time and size."""
+        try:
+            stat = self.requirements_file.stat()
+        except OSError:
             return None
+        return (stat.st_mtime_ns, stat.st_size)
 
-        content = self.requirements_file.read_text(encoding="utf-8")
-        return hashlib.sha256(content.encode()).hexdigest()
+    def _read_requirements_file(self) -> tuple[str, dict[str, str]] | None:
+        """Hash and parse the requirements file, reusing results while unchanged.
 
-    def extract_requirements(self) -> dict[str, str]:
-        """Extract requirements with their full text from requirements file."""
-        if not self.requirements_file.exists():
-            return {}
-
-        content = self.requirements_file.read_text(encoding="utf-8")
-        requirements = {}
+        Returns:
+            Tuple of (file hash, requirements), or None if there is no file
+        """
+        stat_key = self._stat_key()
+        if stat_key is None:
+            return None
+        if self._parsed is not None and self._parsed[0] == stat_key:
+            return self._parsed[1], self._parsed[2]
 
+        # Hash the raw bytes and decode them once for parsing
+        data = self.requirements_file.read_bytes()
+        file_hash = hashlib.sha256(data).hexdigest()
+        content = data.decode("utf-8")
         # Extract requirements with their descriptions using configured patterns
-        for pattern in self.config.requirement_patterns:
-            markdown_pattern = rf"-\s+\*\*({pattern})\*\*:\s+(.+)"
-            matches = re.findall(
-                markdown_pattern, content, re.MULTILINE | re.IGNORECASE
-            )
+        requirements = {
+            req_id.upper(): description.strip()
+            for req_id, description in self._description_re.findall(content)
+        }
 
-            for req_id, description in matches:
-                requirements[req_id.upper()] = description.strip()
+        self._parsed = (stat_key, file_hash, requirements)
+        return file_hash, requirements
 
-        return requirements
+    def get_requirements_hash(self) -> str | None:
+        """Calculate hash of requirements file content."""
+        parsed = self._read_requirements_file()
+        return parsed[0] if parsed else None
+
+    def extract_requirements(self) -> dict[str, str]:
+        """Extract requirements with their full text from requirements file."""
+        parsed = self._read_requirements_file()
+        return dict(parsed[1]) if parsed else {}
 
     def get_requirement_hashes(self, requirements: dict[str, str]) -> dict[str, str]:
-        """Calculate individual hashes for each requirement."""
-        req_hashes = {}
-        for req_id, description in requirements.items():
-            combined = f"{req_id}:{description}"
-            req_hashes[req_id] = hashlib.sha256(combined.encode()).hexdigest()
-        return req_hashes
+        """Calculate individual hashes for each requirement.
+
+        These are only compared for equality, so a small BLAKE2s digest is used;
+        SHA-256 setup cost dominates for inputs this short.
+        """
+        blake2s = hashlib.blake2s
+        return {
+            req_id: blake2s(
+                f"{req_id}:{description}".encode(), digest_size=16
+            ).hexdigest()
+            for req_id, description in requirements.items()
+        }
 
     def load_cache(self) -> dict[str, Any]:
         """Load the previous requirements cache."""
-        if not self.cache_file.exists():
-            return {}
-
         try:
             with open(self.cache_file) as f:
-                return json.load(f)
+                cache = json.load(f)
         except (OSError, json.JSONDecodeError):
             return {}
 
+        # Hashes from other cache versions are not comparable
+        if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+            return {}
+        return cache
+
     def save_cache(self, data: dict[str, Any]) -> None:
         """Save the current requirements cache."""
         try:
@@ -83,73 +180,107 @@ class RequirementChangeDetector:
         except OSError as e:
             print(f"Warning: Could not save cache: {e}")
 
+    def _coverage_cache_key(self) -> dict[str, Any]:
+        """Identify the inputs of a test run.
+
+        These are the requirements, sources and config, the requirement ID
+        patterns, and the database environment the tests run against.
+        """
+        env = os.environ
+        return {
+            "version": CACHE_VERSION,
+            "file_hash": self.get_requirements_hash(),
+            "sources": _sources_digest(Path.cwd()),
+            "patterns": self.config.requirement_regex.pattern,
+            "database": self.config.get_database_type(),
+            "database_env": {
+                env_var: env.get(env_var)
+                for env_var in self.config.database_detect_env_vars
+            },
+        }
+
+    def _load_coverage_cache(self, key: dict[str, Any]) -> dict[str, list[str]] | None:
+        """Load the cached coverage mapping if it was obtained from the same inputs."""
+        try:
+            with open(self.coverage_cache_file) as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if not isinstance(cache, dict) or cache.get("key") != key:
+            return None
+        mapping: dict[str, list[str]] = cache.get("coverage_mapping", {})
+        return mapping
+
+    def _save_coverage_cache(
+        self, key: dict[str, Any], mapping: dict[str, list[str]]
+    ) -> None:
+        """Save a freshly obtained coverage mapping with its inputs."""
+        try:
+            self.coverage_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.coverage_cache_file, "w") as f:
+                json.dump({"key": key, "coverage_mapping": mapping}, f, indent=2)
+        except OSError as e:
+            print(f"Warning: Could not save coverage cache: {e}")
+
     def get_test_coverage_mapping(self) -> dict[str, list[str]]:
-        """Get mapping of requirements to tests, only including passing tests."""
+        """Get mapping of requirements to tests, only including passing tests.
+
+        The test suite is run once per detector; later calls reuse the result.
+        If the inputs of the last passing run are unchanged (see
+        _coverage_cache_key), its cached result is used without running the
+        tests. Failed runs are not cached, as their failures may not come from
+        the inputs.
+        """
+        if self._coverage_mapping is not None:
+            return self._coverage_mapping
+
+        key = self._coverage_cache_key()
+        cached = self._load_coverage_cache(key)
+        if cached is not None:
+            self._coverage_mapping = cached
+            return cached
+
         try:
             # Determine database type for test run
             database_type = self.config.get_database_type()
-            env_vars = dict(__import__("os").environ)
+            env_vars = dict(os.environ)
 
             # Set appropriate database URL for tests
             if database_type.lower() == "sqlite":
                 env_vars["DATABASE_URL"] = "sqlite://"
 
-            # Run full test suite to get actual results
-            result = subprocess.run(
-                ["pytest", "--requirements-report", "-v"],
-                capture_output=True,
-                text=True,
-                cwd=Path.cwd(),
-                env=env_vars,
-            )
-
-            # Parse both the requirements mapping and test results
-            req_to_tests = defaultdict(list)
-            test_results = {}  # test_name -> passed/failed
-            lines = result.stdout.split("\n")
-
-            # First pass: collect test results
-            for line in lines:
-                line = line.strip()
-                if " PASSED " in line or " FAILED " in line:
-                    # Extract test name from pytest output lines
-                    parts = line.split("::")
-                    if len(parts) >= 2:
-                        test_name = parts[-1].split()[
-                            0
-                        ]  # Get test name before PASSED/FAILED
-                        test_results[test_name] = "PASSED" in line
-
-            # Second pass: collect requirements mapping (only from passing tests)
-            in_requirements_section = False
-            current_req = None
-
-            for line in lines:
-                line = line.strip()
-
-                if "Requirements Coverage" in line:
-                    in_requirements_section = True
-                    continue
-                elif "Requirements Coverage Summary" in line:
-                    break
-
-                if not in_requirements_section:
-                    continue
-
-                # Look for requirement headers using configured patterns
-                for pattern in self.config.requirement_patterns:
-                    if re.match(rf"^{pattern}:$", line, re.IGNORECASE):
-                        current_req = line.rstrip(":").upper()
-                        break
-
-                # Look for test entries like "    ✓ test_veto_idempotency"
-                if current_req and line.startswith("✓"):
-                    test_name = line[2:].strip()  # Remove "✓ " prefix
-                    # Only include if test actually passed
-                    if test_results.get(test_name, False):
-                        req_to_tests[current_req].append(test_name)
-
-            return dict(req_to_tests)
+            # Run full test suite, letting the plugin write the results as JSON
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                report_file = Path(tmp_dir) / "requirements_report.json"
+                result = subprocess.run(
+                    [
+                        "pytest",
+                        f"--requirements-report-json={report_file}",
+                        "-q",
+                        "-p",
+                        "no:cacheprovider",
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    cwd=Path.cwd(),
+                    env=env_vars,
+                )
+                report = json.loads(report_file.read_text(encoding="utf-8"))
+
+            # Only include tests that actually passed
+            req_to_tests: dict[str, set[str]] = defaultdict(set)
+            for req, tests in report["requirements"].items():
+                for test_info in tests:
+                    if test_info["result"] == "passed":
+                        req_to_tests[req].add(test_info["test_name"])
+
+            self._coverage_mapping = {
+                req: sorted(tests) for req, tests in req_to_tests.items()
+            }
+            if result.returncode == 0:
+                self._save_coverage_cache(key, self._coverage_mapping)
+            return self._coverage_mapping
 
         except Exception as e:
             print(f"Warning: Could not get test coverage: {e}")
@@ -157,26 +288,36 @@ class RequirementChangeDetector:
 
     def detect_changes(self) -> dict[str, Any]:
         """Detect changes in requirements and identify affected tests."""
-        # Get current requirements
-        current_requirements = self.extract_requirements()
-        current_req_hashes = self.get_requirement_hashes(current_requirements)
-        current_file_hash = self.get_requirements_hash()
+        changes: dict[str, Any] = {
+            "file_changed": False,
+            "added_requirements": [],
+            "modified_requirements": [],
+            "removed_requirements": [],
+            "affected_tests": [],
+        }
 
         # Load previous state
         cache = self.load_cache()
         previous_req_hashes = cache.get("requirement_hashes", {})
         previous_file_hash = cache.get("file_hash")
 
-        # Determine what changed
-        changes: dict[str, Any] = {
-            "file_changed": current_file_hash != previous_file_hash,
-            "added_requirements": [],
-            "modified_requirements": [],
-            "removed_requirements": [],
-            "affected_tests": set(),
-        }
+        # Same modification time and size as last check: skip reading the file
+        stat_key = self._stat_key()
+        if stat_key is not None and cache.get("stat_key") == list(stat_key):
+            return changes
+
+        # Get current requirements
+        current_requirements = self.extract_requirements()
+        current_req_hashes = self.get_requirement_hashes(current_requirements)
+        current_file_hash = self.get_requirements_hash()
+
+        # Determine what changed; the content hash decides, not the stat key
+        changes["file_changed"] = current_file_hash != previous_file_hash
 
         if not changes["file_changed"]:
+            if stat_key is not None and cache:
+                # File touched without content changes: remember the new stat key
+                self.save_cache({**cache, "stat_key": list(stat_key)})
             return changes  # No changes detected
 
         # Find specific requirement changes
@@ -191,9 +332,6 @@ class RequirementChangeDetector:
             if current_req_hashes[req_id] != previous_req_hashes.get(req_id):
                 changes["modified_requirements"].append(req_id)
 
-        # Get test coverage to identify affected tests
-        req_to_tests = self.get_test_coverage_mapping()
-
         # Collect affected tests
         affected_reqs = (
             changes["added_requirements"]
@@ -201,17 +339,21 @@ class RequirementChangeDetector:
             + changes["removed_requirements"]
         )
 
-        for req_id in affected_reqs:
-            tests = req_to_tests.get(req_id, [])
-            changes["affected_tests"].update(tests)
+        # Get test coverage to identify affected tests; the tests are only run
+        # when requirements changed and no cached result matches
+        req_to_tests = self.get_test_coverage_mapping() if affected_reqs else {}
 
-        changes["affected_tests"] = list(changes["affected_tests"])
+        changes["affected_tests"] = sorted(
+            {test for req_id in affected_reqs for test in req_to_tests.get(req_id, [])}
+        )
 
         # Update cache
         new_cache = {
+            "version": CACHE_VERSION,
             "file_hash": current_file_hash,
+            "stat_key": list(stat_key) if stat_key is not None else None,
             "requirement_hashes": current_req_hashes,
-            "last_check": __import__("datetime").datetime.now().isoformat(),
+            "last_check": datetime.now().isoformat(),
         }
         self.save_cache(new_cache)
 
@@ -245,7 +387,7 @@ class RequirementChangeDetector:
 
         if changes["affected_tests"]:
             print("🧪 **Tests that may need review:**")
-            for test in sorted(changes["affected_tests"]):
+            for test in changes["affected_tests"]:
                 print(f"   - {test}")
             print()
             print(
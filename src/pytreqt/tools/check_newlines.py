@@ -1,7 +1,10 @@
 #!/usr/bin/env uv run python
 """Check for trailing newlines in text files."""
 
+import os
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -9,37 +12,62 @@ from rich.console import Console
 
 console = Console()
 
+# Byte value of "\n", compared against the last byte of each file
+_NEWLINE = ord("\n")
+
+# Positional read, not available on all platforms
+_pread = getattr(os, "pread", None)
+
+
+def _needs_newline(path: Path) -> Path | None:
+    """Get the path if it is a non-empty file whose last byte is not a newline."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        st = os.fstat(fd)
+        # Skip non-files or empty files
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            return None
+        # Read only the last byte
+        if _pread is not None:
+            last = _pread(fd, 1, st.st_size - 1)
+        else:
+            os.lseek(fd, -1, os.SEEK_END)
+            last = os.read(fd, 1)
+    finally:
+        os.close(fd)
+    return None if last and last[0] == _NEWLINE else path
+
 
 @click.command()
 @click.option("--fix", is_flag=True, help="Fix missing newlines")
 @click.argument("files", nargs=-1, type=click.Path(exists=True, path_type=Path))
 def main(fix: bool, files: tuple[Path, ...]) -> None:
     """Check that all relevant files end with a newline."""
-    missing: list[Path] = []
+    candidates: list[Path] = []
 
     if files:
         # Check specific files
-        for f in files:
-            if not f.is_file() or f.stat().st_size == 0:
-                continue
-            # Check if file ends with newline
-            if f.read_bytes()[-1:] != b"\n":
-                missing.append(f)
+        candidates.extend(files)
     else:
-        # Check all files matching patterns
-        patterns = [
-            "*.py",
-            "*.md",
-            "*.toml",
-            "*.yml",
-            "*.yaml",
-            "*.sh",
-            ".gitignore",
-            "*.txt",
-            "*.json",
-            "*.html",
-            "*.css",
-        ]
+        # Check all files with these extensions or names
+        extensions = frozenset(
+            {
+                ".py",
+                ".md",
+                ".toml",
+                ".yml",
+                ".yaml",
+                ".sh",
+                ".txt",
+                ".json",
+                ".html",
+                ".css",
+            }
+        )
+        names = frozenset({".gitignore"})
         exclude = {
             ".venv",
             ".git",
@@ -52,35 +80,24 @@ def main(fix: bool, files: tuple[Path, ...]) -> None:
             "htmlcov",
         }
 
-        # Check files with extensions
-        for pattern in patterns:
-            for f in Path(".").rglob(pattern):
-                # Skip excluded directories
-                if any(p in f.parts for p in exclude):
-                    continue
+        # Walk the tree once, pruning excluded directories before descending
+        for root, dirs, filenames in os.walk("."):
+            dirs[:] = [d for d in dirs if d not in exclude]
+            # Skip specific files that are auto-generated
+            in_egg_info = "egg-info" in root
 
-                # Skip specific files that are auto-generated
-                if f.name == "SOURCES.txt" and any(
-                    "egg-info" in str(part) for part in f.parts
-                ):
+            for name in filenames:
+                if os.path.splitext(name)[1] not in extensions and name not in names:
                     continue
-
-                # Skip non-files or empty files
-                if not f.is_file() or f.stat().st_size == 0:
+                if in_egg_info and name == "SOURCES.txt":
                     continue
 
-                # Check if file ends with newline
-                if f.read_bytes()[-1:] != b"\n":
-                    missing.append(f)
-
-        # Check specific root-level executable scripts
-        root_executables = ["noxfile.py"]
-        for name in root_executables:
-            f = Path(".") / name
-            if f.is_file() and f.stat().st_size > 0:
-                # Check if file ends with newline
-                if f.read_bytes()[-1:] != b"\n":
-                    missing.append(f)
+                candidates.append(Path(root, name))
+
+    # Checking a file is a stat and a 1-byte read, so overlap them in threads
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        missing = [f for f in executor.map(_needs_newline, candidates) if f]
 
     if missing:
         if fix:
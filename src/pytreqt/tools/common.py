@@ -45,6 +45,39 @@ def run_command_with_env(
         return False
 
 
+def run_pytest(
+    args: list[str], description: str, env: dict[str, str] | None = None
+) -> bool:
+    """Run pytest in this process, with environment variables set for the run.
+
+    The run shares this process's imported modules and plugin state, so tests
+    are not isolated from the caller as with a pytest subprocess.
+    """
+    import pytest
+
+    from ..plugin import COMMAND_ENV_VAR
+
+    print(f"🔄 {description}...")
+    # sys.argv holds the caller's command, so pass the pytest one explicitly
+    env = {COMMAND_ENV_VAR: " ".join(["pytest", *args]), **(env or {})}
+    saved_env = {name: os.environ.get(name) for name in env}
+    os.environ.update(env)
+    try:
+        exit_code = pytest.main(args)
+    finally:
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    if exit_code == 0:
+        print(f"✅ {description} completed\n")
+        return True
+    print(f"❌ {description} failed with exit code {int(exit_code)}\n")
+    return False
+
+
 def validate_requirements_file_exists() -> bool:
     """Validate that the requirements file exists."""
     config = get_config()
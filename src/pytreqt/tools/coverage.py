@@ -3,86 +3,192 @@
 Generate TEST_COVERAGE.md from requirements and test coverage data.
 """
 
+import hashlib
+import json
+import os
 import re
 import sys
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from ..config import get_config
 from .common import validate_requirements_file_exists
 
+if TYPE_CHECKING:
+    from .changes import RequirementChangeDetector
+
+
+@lru_cache(maxsize=8)
+def _definition_regex(id_pattern: str) -> re.Pattern[str]:
+    """Compile the requirement definition regex for an ID pattern alternation.
+
+    Matches lines like "**FR-1.1**: Users can create objects", capturing the
+    ID and the description.
+    """
+    return re.compile(rf"\*\*({id_pattern})\*\*:\s+(.+)", re.MULTILINE | re.IGNORECASE)
+
+
+def _specs_cache_key(raw: bytes, id_pattern: str) -> str:
+    """Identify requirements file content parsed with an ID pattern alternation."""
+    return hashlib.sha256(raw + b"\0" + id_pattern.encode()).hexdigest()
+
+
+def _load_specs_cache(cache_file: Path, key: str) -> dict[str, str] | None:
+    """Load requirements parsed in an earlier run from the same input."""
+    try:
+        cache = json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cache, dict) or cache.get("key") != key:
+        return None
+    requirements: dict[str, str] = cache.get("requirements", {})
+    return requirements
+
+
+def _save_specs_cache(cache_file: Path, key: str, requirements: dict[str, str]) -> None:
+    """Save parsed requirements, replacing the cache file atomically."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        tmp_file.write_text(
+            json.dumps({"key": key, "requirements": requirements}, indent=2),
+            encoding="utf-8",
+        )
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not save requirements cache: {e}")
+
+
+@lru_cache(maxsize=8)
+def _parse_specs(
+    path_str: str, mtime_ns: int, id_pattern: str, cache_file_str: str
+) -> dict[str, str]:
+    """Parse requirements, reusing the result until the file's mtime changes.
+
+    Across processes, results are cached in cache_file keyed by the file
+    content. The returned dict is shared between callers and must not be
+    modified.
+    """
+    raw = Path(path_str).read_bytes()
+    cache_file = Path(cache_file_str)
+    key = _specs_cache_key(raw, id_pattern)
+    cached = _load_specs_cache(cache_file, key)
+    if cached is not None:
+        return cached
+
+    content = raw.decode("utf-8")
+
+    # Extract requirements with descriptions using configured patterns.
+    # Every definition is in bold, so without "**" the scan can be skipped.
+    requirements: dict[str, str] = {}
+    if "**" in content:
+        requirements = {
+            req_id.upper(): description.strip()
+            for req_id, description in _definition_regex(id_pattern).findall(content)
+        }
+    _save_specs_cache(cache_file, key, requirements)
+    return requirements
+
 
 def extract_requirements_from_specs() -> dict[str, str]:
-    """Extract all defined requirements from requirements file."""
+    """Extract all defined requirements from requirements file.
+
+    Parsed requirements are cached in memory and in the cache directory, so
+    unchanged files are not parsed again.
+    """
     config = get_config()
     requirements_file = config.requirements_file
 
-    if not requirements_file.exists():
+    # A fresh stat, as the modification time keys the parse cache
+    try:
+        mtime_ns = requirements_file.stat().st_mtime_ns
+    except OSError:
         print(f"ERROR: {requirements_file} not found")
         return {}
 
-    content = requirements_file.read_text(encoding="utf-8")
-    requirements = {}
-
-    # Extract requirements with descriptions using configured patterns
-    for pattern in config.requirement_patterns:
-        # Pattern matches lines like "**FR-1.1**: Users can create objects"
-        markdown_pattern = rf"\*\*({pattern})\*\*:\s+(.+)"
-        matches = re.findall(markdown_pattern, content, re.MULTILINE | re.IGNORECASE)
+    return dict(
+        _parse_specs(
+            str(requirements_file.resolve()),
+            mtime_ns,
+            config.requirement_regex.pattern,
+            str(config.cache_dir / "specs_cache.json"),
+        )
+    )
 
-        for req_id, description in matches:
-            requirements[req_id.upper()] = description.strip()
 
-    return requirements
+def _get_test_coverage(
+    detector: "RequirementChangeDetector | None" = None,
+) -> dict[str, list[str]]:
+    """Get requirements coverage data from change detector.
 
-
-def _get_test_coverage() -> dict[str, list[str]]:
-    """Get requirements coverage data from change detector."""
+    Args:
+        detector: Detector to reuse, so its test run result is shared with
+            other callers in the same process
+    """
     try:
-        from .changes import RequirementChangeDetector
+        if detector is None:
+            from .changes import RequirementChangeDetector
 
-        detector = RequirementChangeDetector()
+            detector = RequirementChangeDetector()
         return detector.get_test_coverage_mapping()
     except Exception as e:
         print(f"ERROR getting test coverage: {e}")
         return {}
 
 
+# Buffer size for streaming reads of generated reports
+_READ_BUFFER_SIZE = 128 * 1024
+
+# Summary fields of a generated coverage report, e.g. "**Last updated**: 2025-09-13"
+_SUMMARY_RE = re.compile(
+    r"^(?:\*\*Last updated\*\*:\s*(?P<timestamp>[^*\n]+)"
+    r"|- \*\*Total Requirements\*\*:\s*(?P<total_requirements>\d+)"
+    r"|- \*\*Requirements with Tests\*\*:\s*(?P<tested_requirements>\d+)"
+    r"|\*\*Coverage Percentage\*\*:\s*(?P<coverage_percentage>[\d.]+)%)",
+    re.MULTILINE,
+)
+
+
 def _get_previous_coverage() -> dict[str, str | int | float] | None:
     """Get previous coverage data from existing report."""
     config = get_config()
     coverage_file = config.reports_output_dir / config.coverage_filename
 
-    if not coverage_file.exists():
-        return None
-
+    # Extract previous stats from the summary at the top of the report,
+    # streaming lines and stopping once all of them are found
+    previous_data: dict[str, str | int | float] = {}
     try:
-        content = coverage_file.read_text(encoding="utf-8")
-        lines = content.split("\n")
-
-        # Extract previous stats
-        previous_data = {}
-        for line in lines:
-            if "Last updated" in line:
-                # Extract date from **Last updated**: 2025-09-13**
-                match = re.search(r"Last updated\*\*:\s*([^\*]+)", line)
-                if match:
-                    previous_data["timestamp"] = match.group(1).strip()
-            elif "Total Requirements" in line:
-                match = re.search(r"(\d+)", line)
-                if match:
-                    previous_data["total_requirements"] = int(match.group(1))
-            elif "Requirements with Tests" in line:
-                match = re.search(r"(\d+)", line)
-                if match:
-                    previous_data["tested_requirements"] = int(match.group(1))
-            elif "Coverage Percentage" in line:
-                match = re.search(r"([\d.]+)%", line)
-                if match:
-                    previous_data["coverage_percentage"] = float(match.group(1))
-
-        return previous_data if previous_data else None
-    except Exception:
+        with open(coverage_file, "rb", buffering=_READ_BUFFER_SIZE) as f:
+            for raw_line in f:
+                # Every summary field is in bold
+                if b"**" not in raw_line:
+                    continue
+                match = _SUMMARY_RE.match(raw_line.decode("utf-8"))
+                if match is None or match.lastgroup is None:
+                    continue
+                key = match.lastgroup
+                if key in previous_data:
+                    continue
+                value = match.group(key)
+                if key == "timestamp":
+                    previous_data[key] = value.strip()
+                elif key == "coverage_percentage":
+                    try:
+                        previous_data[key] = float(value)
+                    except ValueError:
+                        continue
+                else:
+                    previous_data[key] = int(value)
+                if len(previous_data) == len(_SUMMARY_RE.groupindex):
+                    break
+    except (OSError, UnicodeDecodeError):
         return None
 
+    return previous_data if previous_data else None
+
 
 def _coverage_changed(
     previous: dict[str, str | int | float] | None, current: dict[str, str | int | float]
@@ -95,43 +201,92 @@ def _coverage_changed(
     prev_total = previous.get("total_requirements", 0)
     prev_tested = previous.get("tested_requirements", 0)
     prev_pct = previous.get("coverage_percentage", 0)
+    current_pct = current["coverage_percentage"]
 
+    # Counts first; percentages are compared in tenths, as shown in the report
     return (
         prev_total != current["total_requirements"]
         or prev_tested != current["tested_requirements"]
-        or abs(float(prev_pct) - float(current["coverage_percentage"])) > 0.1
+        or round(float(prev_pct) * 10) != round(float(current_pct) * 10)
     )
 
 
-def _generate_coverage_matrix() -> str | None:
-    """Generate the complete coverage matrix."""
+def _generate_coverage_matrix(
+    detector: "RequirementChangeDetector | None" = None,
+    all_requirements: dict[str, str] | None = None,
+) -> tuple[str, dict[str, Any]] | None:
+    """Generate the complete coverage matrix.
+
+    Args:
+        detector: Change detector whose test coverage mapping to use
+        all_requirements: Requirements already extracted from specifications
+
+    Returns:
+        Tuple of (Markdown report, machine-readable summary), or None if there
+        are no requirements
+    """
     get_config()
 
-    print("Extracting requirements from specifications...")
-    all_requirements = extract_requirements_from_specs()
+    if all_requirements is None:
+        print("Extracting requirements from specifications...")
+        all_requirements = extract_requirements_from_specs()
 
     print("Analyzing test coverage...")
-    test_coverage = _get_test_coverage()
+    test_coverage = _get_test_coverage(detector)
+
+    # Same inputs as the existing report: reuse it instead of rendering again
+    fingerprint = _coverage_fingerprint(all_requirements, test_coverage)
+    if all_requirements:
+        unchanged = _load_unchanged_report(fingerprint)
+        if unchanged is not None:
+            return unchanged
+
+    # Render the per-requirement sections in a single pass over the sorted
+    # requirements, counting tested requirements and collecting untested ones
+    tested: list[str] = []
+    total_tests = 0
+    untested: list[tuple[str, str]] = []
+    # One chunk per requirement section, joined with the rest of the report
+    body_chunks: list[str] = []
+    append = body_chunks.append
+    for req_id, description in sorted(all_requirements.items()):
+        # Tests are unique and sorted per requirement
+        tests = test_coverage.get(req_id, [])
+
+        if tests:
+            tested.append(req_id)
+            total_tests += len(tests)
+            test_cases = "\n".join([f"- `{test}`" for test in tests])
+            append(
+                f"### {req_id}: {description}\n**Status**: ✅ **Tested**\n\n"
+                f"**Test Cases**:\n{test_cases}\n"
+            )
+        else:
+            untested.append((req_id, description))
+            append(
+                f"### {req_id}: {description}\n**Status**: ❌ **Not Tested**\n\n"
+                "**Test Cases**: None\n⚠️ *This requirement needs test coverage*\n"
+            )
+    total_count = len(all_requirements)
+    tested_count = len(tested)
+    coverage_pct = tested_count / total_count * 100 if total_count else 0.0
 
     # Get previous coverage to check if it changed
     previous_coverage = _get_previous_coverage()
     current_coverage_data: dict[str, str | int | float] = {
-        "total_requirements": len(all_requirements),
-        "tested_requirements": len(test_coverage),
-        "coverage_percentage": (
-            len(test_coverage) / len(all_requirements) * 100 if all_requirements else 0
-        ),
+        "total_requirements": total_count,
+        "tested_requirements": tested_count,
+        "coverage_percentage": coverage_pct,
     }
 
     # Only update timestamp if coverage actually changed
-    if _coverage_changed(previous_coverage, current_coverage_data):
-        timestamp = __import__("datetime").datetime.now().strftime("%Y-%m-%d")
+    timestamp: str | int | float
+    if previous_coverage and not _coverage_changed(
+        previous_coverage, current_coverage_data
+    ):
+        timestamp = previous_coverage.get("timestamp", "unchanged")
     else:
-        timestamp = (
-            previous_coverage.get("timestamp", "unchanged")
-            if previous_coverage
-            else __import__("datetime").datetime.now().strftime("%Y-%m-%d")
-        )
+        timestamp = datetime.now().strftime("%Y-%m-%d")
 
     if not all_requirements:
         print("No requirements found!")
@@ -147,43 +302,18 @@ def _generate_coverage_matrix() -> str | None:
         "",
         "## Coverage Summary",
         "",
-        f"- **Total Requirements**: {len(all_requirements)}",
-        f"- **Requirements with Tests**: {len(test_coverage)}",
-        "- **Requirements without Tests**: "
-        + f"{len(all_requirements) - len(test_coverage)}",
+        f"- **Total Requirements**: {total_count}",
+        f"- **Requirements with Tests**: {tested_count}",
+        f"- **Requirements without Tests**: {total_count - tested_count}",
         "",
-        "**Coverage Percentage**: "
-        + f"{len(test_coverage) / len(all_requirements) * 100:.1f}%",
+        f"**Coverage Percentage**: {coverage_pct:.1f}%",
         "",
         "## Requirements Coverage",
         "",
     ]
+    report_lines += body_chunks
 
-    # Sort requirements by ID
-    sorted_requirements = sorted(all_requirements.items())
-
-    for req_id, description in sorted_requirements:
-        tests = test_coverage.get(req_id, [])
-        # Remove duplicates while preserving order
-        unique_tests = list(dict.fromkeys(tests))
-        status = "✅ **Tested**" if unique_tests else "❌ **Not Tested**"
-
-        report_lines.extend(
-            [f"### {req_id}: {description}", f"**Status**: {status}", ""]
-        )
-
-        if unique_tests:
-            report_lines.append("**Test Cases**:")
-            for test in sorted(unique_tests):  # Also sort for consistency
-                report_lines.append(f"- `{test}`")
-            report_lines.append("")
-        else:
-            report_lines.extend(
-                ["**Test Cases**: None", "⚠️ *This requirement needs test coverage*", ""]
-            )
-
-    # Add untested requirements section
-    untested = [req for req in all_requirements if req not in test_coverage]
+    # Add untested requirements section, already in ID order
     if untested:
         report_lines.extend(
             [
@@ -193,27 +323,22 @@ def _generate_coverage_matrix() -> str | None:
                 "",
             ]
         )
-
-        for req_id in sorted(untested):
-            description = all_requirements[req_id]
-            report_lines.append(f"- **{req_id}**: {description}")
-
+        report_lines.extend(
+            f"- **{req_id}**: {description}" for req_id, description in untested
+        )
         report_lines.append("")
 
-    # Add test statistics (deduplicated)
-    total_tests = sum(
-        len(list(dict.fromkeys(tests))) for tests in test_coverage.values()
-    )
+    # Add test statistics
     report_lines.extend(
         [
             "## Test Statistics",
             "",
             f"- **Total Test Cases with Requirements**: {total_tests}",
-            f"- **Unique Requirements Tested**: {len(test_coverage)}",
+            f"- **Unique Requirements Tested**: {tested_count}",
             (
                 "- **Average Tests per Requirement**: "
-                + f"{total_tests / len(test_coverage):.1f}"
-                if test_coverage
+                + f"{total_tests / tested_count:.1f}"
+                if tested_count
                 else "- **Average Tests per Requirement**: 0"
             ),
             "",
@@ -224,32 +349,113 @@ def _generate_coverage_matrix() -> str | None:
         ]
     )
 
-    return "\n".join(report_lines) + "\n"
+    summary = {
+        "total_requirements": total_count,
+        "tested_requirements": tested_count,
+        "coverage_percentage": round(coverage_pct, 1),
+        "tested": tested,
+        "untested": [req_id for req_id, _ in untested],
+        "fingerprint": fingerprint,
+    }
+    report = "\n".join(report_lines) + "\n"
+    # Ties the summary to exactly this report text
+    summary["report_sha256"] = _report_digest(report.encode("utf-8"))
+    return report, summary
+
+
+def _coverage_fingerprint(
+    all_requirements: dict[str, str], test_coverage: dict[str, list[str]]
+) -> str:
+    """Identify the inputs of a coverage report."""
+    data = json.dumps([all_requirements, test_coverage], sort_keys=True)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _report_digest(data: bytes) -> str:
+    """Hash the bytes of a coverage report."""
+    return hashlib.sha256(data).hexdigest()
+
 
+def load_coverage_summary() -> tuple[str, dict[str, Any]] | None:
+    """Load the coverage report and the JSON summary written with it.
 
-def main() -> None:
-    """Main function to generate and write the coverage report."""
+    Returns:
+        Tuple of (report text, summary), or None if either is missing or the
+        summary was not written for the report's current content
+    """
+    config = get_config()
+    coverage_file = config.reports_output_dir / config.coverage_filename
+    try:
+        summary = json.loads(coverage_summary_file().read_bytes())
+        data = coverage_file.read_bytes()
+        if not isinstance(summary, dict):
+            return None
+        if summary.get("report_sha256") != _report_digest(data):
+            return None
+        return data.decode("utf-8"), summary
+    except (OSError, ValueError):
+        return None
+
+
+def _load_unchanged_report(fingerprint: str) -> tuple[str, dict[str, Any]] | None:
+    """Load the existing report and summary if they were built from the same inputs."""
+    existing = load_coverage_summary()
+    if existing is None or existing[1].get("fingerprint") != fingerprint:
+        return None
+    return existing
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write a text file atomically unless it already has exactly this content."""
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    tmp_file = path.with_name(path.name + ".tmp")
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, path)
+
+
+def coverage_summary_file() -> Path:
+    """Get the JSON summary file written next to the coverage report."""
+    config = get_config()
+    return (config.reports_output_dir / config.coverage_filename).with_suffix(".json")
+
+
+def main(detector: "RequirementChangeDetector | None" = None) -> None:
+    """Main function to generate and write the coverage report.
+
+    Args:
+        detector: Change detector to reuse, so a test run it already made is
+            not repeated
+    """
     config = get_config()
     validate_requirements_file_exists()
 
+    print("Extracting requirements from specifications...")
+    all_requirements = extract_requirements_from_specs()
+
     # Generate the report
-    report_content = _generate_coverage_matrix()
-    if not report_content:
+    result = _generate_coverage_matrix(detector, all_requirements)
+    if not result:
         print("Failed to generate coverage report")
         sys.exit(1)
+    report_content, summary = result
 
     # Write to the reports directory
     reports_dir = config.reports_output_dir
     reports_dir.mkdir(exist_ok=True)
 
+    # Unchanged files are left alone, keeping their modification times
     coverage_file = reports_dir / config.coverage_filename
-    coverage_file.write_text(report_content, encoding="utf-8")
+    _write_if_changed(coverage_file, report_content)
+    # Machine-readable summary for pytreqt stats
+    _write_if_changed(coverage_summary_file(), json.dumps(summary, indent=2) + "\n")
 
     print(f"✅ Coverage report generated: {coverage_file}")
-    print(
-        "📊 Coverage summary: "
-        + f"{len(extract_requirements_from_specs())} total requirements"
-    )
+    print(f"📊 Coverage summary: {len(all_requirements)} total requirements")
 
 
 if __name__ == "__main__":
@@ -2,20 +2,35 @@
 
 import csv
 import json
+import re
 import sys
-
-from rich.console import Console
-from rich.table import Table
+from collections import defaultdict
 
 from ..config import get_config
 
 
+def _parse_tested_requirements(content: str) -> set[str]:
+    """Find tested requirement IDs in a Markdown coverage report."""
+    tested_requirements = set()
+    lines = content.split("\n")
+    for i, line in enumerate(lines):
+        if "**Status**: ✅ **Tested**" in line:
+            # Find requirement ID in the line immediately before
+            if i > 0:
+                prev_line = lines[i - 1]
+                if "###" in prev_line:
+                    # Extract requirement ID from lines like "### FR-1.1: Description"
+                    req = prev_line.split(":")[0].replace("### ", "").strip()
+                    tested_requirements.add(req)
+    return tested_requirements
+
+
 def show_stats(format: str = "text") -> None:
     """Show detailed requirements statistics."""
     config = get_config()
 
     # Load valid requirements using same method as coverage report
-    from .coverage import extract_requirements_from_specs
+    from .coverage import extract_requirements_from_specs, load_coverage_summary
 
     valid_requirements_dict = extract_requirements_from_specs()
     valid_requirements = set(valid_requirements_dict.keys())
@@ -26,33 +41,46 @@ def show_stats(format: str = "text") -> None:
         print("❌ Coverage report not found. " + "Run: pytreqt coverage")
         return
 
-    # Parse coverage data
-    content = coverage_file.read_text()
-    tested_requirements = set()
-    untested_requirements = set()
+    # Prefer the JSON summary written for the report's current content
+    tested_requirements: set[str] | None = None
+    existing = load_coverage_summary()
+    if existing is not None:
+        try:
+            tested_requirements = set(existing[1]["tested"])
+        except (KeyError, TypeError):
+            tested_requirements = None
 
-    lines = content.split("\n")
-    for i, line in enumerate(lines):
-        if "**Status**: ✅ **Tested**" in line:
-            # Find requirement ID in the line immediately before
-            if i > 0:
-                prev_line = lines[i - 1]
-                if "###" in prev_line:
-                    # Extract requirement ID from lines like "### FR-1.1: Description"
-                    req = prev_line.split(":")[0].replace("### ", "").strip()
-                    tested_requirements.add(req)
-        elif "**Status**: ❌ **Not Tested**" in line:
-            if i > 0:
-                prev_line = lines[i - 1]
-                if "###" in prev_line:
-                    req = prev_line.split(":")[0].replace("### ", "").strip()
-                    untested_requirements.add(req)
+    if tested_requirements is None:
+        tested_requirements = _parse_tested_requirements(coverage_file.read_text())
 
     # Calculate statistics
     total_requirements = len(valid_requirements)
     tested_count = len(tested_requirements)
-    # Calculate actual untested requirements
-    untested_requirements = valid_requirements - tested_requirements
+    # Categories are the ID prefixes of the configured patterns, e.g. "FR"
+    categories = list(
+        dict.fromkeys(pattern.split("-")[0] for pattern in config.requirement_patterns)
+    )
+    category_re = re.compile(
+        "({})-".format("|".join(map(re.escape, categories))) if categories else "(?!)"
+    )
+
+    # Categorize requirements in one pass, collecting untested ones
+    untested_requirements = set()
+    req_categories: dict[str, str] = {}
+    category_totals: dict[str, int] = defaultdict(int)
+    category_tested: dict[str, int] = defaultdict(int)
+    for req in valid_requirements:
+        is_tested = req in tested_requirements
+        if not is_tested:
+            untested_requirements.add(req)
+        match = category_re.match(req)
+        if match is None:
+            continue
+        category = match.group(1)
+        req_categories[req] = category
+        category_totals[category] += 1
+        if is_tested:
+            category_tested[category] += 1
     untested_count = len(untested_requirements)
     coverage_percentage = (
         (tested_count / total_requirements * 100) if total_requirements > 0 else 0
@@ -76,17 +104,20 @@ def show_stats(format: str = "text") -> None:
     elif format == "csv":
         writer = csv.writer(sys.stdout)
         writer.writerow(["Requirement", "Status", "Category"])
-        for req in requirements_to_show:
-            status = "Tested" if req in tested_requirements else "Not Tested"
-            # Determine category from configured patterns
-            category = "Unknown"
-            for pattern in config.requirement_patterns:
-                if req.upper().startswith(pattern.split("-")[0] + "-"):
-                    category = pattern.split("-")[0]
-                    break
-            writer.writerow([req, status, category])
+        writer.writerows(
+            [
+                req,
+                "Tested" if req in tested_requirements else "Not Tested",
+                req_categories.get(req, "Unknown"),
+            ]
+            for req in sorted(requirements_to_show)
+        )
 
     else:  # text format
+        # Rich is only needed here; JSON and CSV output skip importing it
+        from rich.console import Console
+        from rich.table import Table
+
         console = Console()
 
         # Overall statistics
@@ -113,14 +144,12 @@ def show_stats(format: str = "text") -> None:
         breakdown_table.add_column("Coverage", style="blue")
 
         # Group by configured patterns
-        for pattern in config.requirement_patterns:
-            prefix = pattern.split("-")[0] + "-"
-            category_reqs = [r for r in valid_requirements if r.startswith(prefix)]
-            category_tested = [r for r in tested_requirements if r.startswith(prefix)]
-
-            if category_reqs:  # Only show categories that have requirements
-                category_total = len(category_reqs)
-                category_tested_count = len(category_tested)
+        for category in categories:
+            prefix = category + "-"
+            category_total = category_totals.get(category, 0)
+
+            if category_total:  # Only show categories that have requirements
+                category_tested_count = category_tested.get(category, 0)
                 category_coverage = (
                     (category_tested_count / category_total * 100)
                     if category_total > 0
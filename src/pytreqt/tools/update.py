@@ -6,11 +6,22 @@ Update requirements traceability - regenerate coverage and check for changes.
 import sys
 
 from ..config import get_config
-from .common import run_command, run_command_with_env, validate_requirements_file_exists
-
-
-def main() -> None:
-    """Update all traceability artifacts."""
+from .common import (
+    run_command,
+    run_command_with_env,
+    run_pytest,
+    validate_requirements_file_exists,
+)
+
+
+def main(in_process: bool = False) -> None:
+    """Update all traceability artifacts.
+
+    Args:
+        in_process: Run the tests in this process instead of a separate pytest
+            process. This saves an interpreter startup, but the tests share
+            this process's imported modules and plugin state.
+    """
     config = get_config()
     validate_requirements_file_exists()
 
@@ -18,9 +29,10 @@ def main() -> None:
 
     # Check for requirement changes
     print("1️⃣  Checking for requirement changes...")
-    try:
-        from .changes import RequirementChangeDetector
+    from .changes import RequirementChangeDetector
 
+    detector: RequirementChangeDetector | None = None
+    try:
         detector = RequirementChangeDetector()
         changes = detector.detect_changes()
         if changes["file_changed"]:
@@ -29,13 +41,15 @@ def main() -> None:
             print("   ✅ No changes detected\n")
     except Exception:
         print("   ⚠️  Warning: Could not check for changes\n")
+        detector = None
 
     # Regenerate coverage report
     print("🔄 2️⃣  Regenerating coverage report...")
     try:
         from .coverage import main as generate_main
 
-        generate_main()
+        # Reuse the detector, sharing any test run it made for the changes
+        generate_main(detector)
         print("✅ 2️⃣  Regenerating coverage report completed\n")
         success = True
     except Exception as e:
@@ -54,7 +68,12 @@ def main() -> None:
 
     # Construct test command
     test_cmd = ["pytest", "-q"]
-    if env_vars:
+    if in_process:
+        # Avoid another interpreter startup and plugin discovery
+        success = run_pytest(
+            test_cmd[1:], "3️⃣  Running tests with requirements coverage", env_vars
+        )
+    elif env_vars:
         # Add environment variables to the command
         import os
 